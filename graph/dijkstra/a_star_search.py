@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import math
+
+from graph.dijkstra.bidirectional_dijkstra import BidirectionalDijkstra
+
+
+def zero_heuristic(vertex, target):
+    """
+    Estimates every remaining distance as 0, which turns A* into Dijkstra's algorithm
+    """
+    return 0
+
+
+def euclidean_heuristic(coordinates, scale=1):
+    """
+    Creates a heuristic estimating remaining distances as straight-line distances between vertex coordinates.
+    It never overestimates as long as no edge weighs less than `scale` times the distance between its ends.
+
+    :param coordinates: a dictionary mapping every vertex to its (x, y) coordinates
+    :param scale: the smallest ratio of an edge weight to the straight-line length of the edge
+    """
+    def heuristic(vertex, target):
+        x, y = coordinates[vertex]
+        target_x, target_y = coordinates[target]
+        return scale * math.hypot(target_x - x, target_y - y)
+    return heuristic
+
+
+def manhattan_heuristic(coordinates, scale=1):
+    """
+    Creates a heuristic estimating remaining distances as the sums of the coordinate differences of vertices,
+    suited to grids whose edges are axis-aligned. It never overestimates as long as no edge weighs less than
+    `scale` times the Manhattan distance between its ends.
+
+    :param coordinates: a dictionary mapping every vertex to its (x, y) coordinates
+    :param scale: the smallest ratio of an edge weight to the Manhattan length of the edge
+    """
+    def heuristic(vertex, target):
+        x, y = coordinates[vertex]
+        target_x, target_y = coordinates[target]
+        return scale * (abs(target_x - x) + abs(target_y - y))
+    return heuristic
+
+
+def compute_distances(source, get_edges):
+    """
+    Computes the distances from a source vertex to all the vertices it reaches.
+
+    :param source: the source vertex
+    :param get_edges: a callable returning the (neighbor, weight) pairs of the edges leaving a vertex
+    :return: a dictionary mapping each reachable vertex to its distance from the source
+    """
+    distances = {source: 0}
+    settled = set()
+    counter = itertools.count()
+    heap = [(0, next(counter), source)]
+    while heap:
+        distance, _, closest = heapq.heappop(heap)
+        if closest in settled:
+            continue
+        settled.add(closest)
+        for n, weight in get_edges(closest):
+            alternative_distance = distance + weight
+            if alternative_distance < distances.get(n, math.inf):
+                distances[n] = alternative_distance
+                heapq.heappush(heap, (alternative_distance, next(counter), n))
+    return distances
+
+
+class LandmarkHeuristic:
+    """
+    A heuristic based on the triangle inequality with a few landmark vertices (ALT).
+    The distances from and to every landmark are precomputed by Dijkstra runs, and for any landmark L
+    both d(L, t) - d(L, v) and d(v, L) - d(t, L) are lower bounds of the distance from v to t.
+    It needs no coordinates, and is consistent on any graph with non-negative weights.
+
+    Landmarks are chosen by farthest-point selection: each new landmark is the vertex whose distance
+    to the closest landmark already chosen is the largest, which places landmarks on the periphery.
+    """
+
+    def __init__(self, graph, landmark_count=4, landmarks=None):
+        """
+        :param graph: the graph whose distances are precomputed
+        :param landmark_count: the number of landmarks to choose, unless they are given
+        :param landmarks: the landmark vertices, chosen automatically if omitted
+        """
+        reverse_index = BidirectionalDijkstra()
+        reverse_index.build_reverse_index(graph)
+        reverse_adjacency = reverse_index.reverse_adjacency
+
+        def get_edges(vertex):
+            return ((n, graph.get_edge_weight_between(vertex, n)) for n in graph.get_neighbors(vertex))
+
+        vertices = graph.get_vertices()
+        if landmarks is None:
+            landmarks = self.choose_landmarks(vertices, get_edges, landmark_count)
+        self.landmarks = landmarks
+        # Distances from each landmark, and to each landmark through the reversed edges
+        self.distances_from = [compute_distances(landmark, get_edges) for landmark in landmarks]
+        self.distances_to = [compute_distances(landmark, reverse_adjacency.__getitem__) for landmark in landmarks]
+
+    @staticmethod
+    def choose_landmarks(vertices, get_edges, landmark_count):
+        """
+        Chooses landmarks by farthest-point selection, starting from the vertex farthest from the first vertex
+        """
+        if not vertices:
+            return []
+        distances = compute_distances(vertices[0], get_edges)
+        landmarks = []
+        closest_landmark_distances = {v: distances.get(v, math.inf) for v in vertices}
+        for _ in range(min(landmark_count, len(vertices))):
+            # Unreachable vertices come first, since no landmark chosen so far bounds their distances
+            landmark = max(closest_landmark_distances, key=closest_landmark_distances.get)
+            landmarks.append(landmark)
+            distances = compute_distances(landmark, get_edges)
+            for v in closest_landmark_distances:
+                closest_landmark_distances[v] = min(closest_landmark_distances[v], distances.get(v, math.inf))
+        return landmarks
+
+    def __call__(self, vertex, target):
+        bound = 0
+        for distances_from, distances_to in zip(self.distances_from, self.distances_to):
+            landmark_to_target = distances_from.get(target, math.inf)
+            landmark_to_vertex = distances_from.get(vertex, math.inf)
+            if landmark_to_vertex < math.inf:
+                if landmark_to_target == math.inf:
+                    return math.inf  # The target is unreachable from the vertex, or it would be from the landmark
+                bound = max(bound, landmark_to_target - landmark_to_vertex)
+            vertex_to_landmark = distances_to.get(vertex, math.inf)
+            target_to_landmark = distances_to.get(target, math.inf)
+            if target_to_landmark < math.inf:
+                if vertex_to_landmark == math.inf:
+                    return math.inf  # The vertex can not reach the target, or it would reach the landmark
+                bound = max(bound, vertex_to_landmark - target_to_landmark)
+        return bound
+
+
+class AStarSearch:
+    """
+    Computes shortest paths between two vertices with the A* algorithm: Dijkstra's algorithm
+    polling vertices by their distance from the source plus a heuristic estimate of their
+    distance to the target, which steers the search towards the target.
+
+    The heuristic must be consistent: for every edge (u, v), h(u) <= weight(u, v) + h(v), and h(target) = 0.
+    The heuristics of this module are. The search then settles fewer vertices than Dijkstra's algorithm,
+    and still returns shortest paths.
+    """
+
+    def __init__(self, heuristic=zero_heuristic):
+        """
+        :param heuristic: a callable estimating the distance from a vertex to a target,
+        called as heuristic(vertex, target)
+        """
+        self.heuristic = heuristic
+        self.settled_count = 0  # Number of vertices settled during the last query
+
+    def shortest_path(self, graph, source, target):
+        """
+        Computes the shortest path between two vertices.
+
+        :param graph: The graph on which to compute the path.
+        :param source: The source vertex of the path.
+        :param target: The target vertex of the path.
+        :return: A list of vertices representing the shortest path, or an empty list if the target is unreachable.
+        """
+        if not graph.has_vertex(source):
+            raise ValueError("Source vertex is not in the graph")
+        if not graph.has_vertex(target):
+            raise ValueError("Target vertex is not in the graph")
+
+        heuristic = self.heuristic
+        distance_from_source_map = {source: 0}
+        predecessor_map = {source: None}
+        settled = set()
+        counter = itertools.count()  # Breaks estimate ties, since vertices are not comparable
+        heap = [(heuristic(source, target), next(counter), source)]
+        self.settled_count = 0
+        while heap:
+            estimate, _, closest_to_source = heapq.heappop(heap)
+            if estimate == math.inf:
+                break  # Only vertices known not to reach the target are left
+            if closest_to_source in settled:
+                continue  # Outdated entry of a vertex reached again with a shorter distance
+            if closest_to_source == target:
+                path = []
+                current = target
+                while current is not None:
+                    path.append(current)
+                    current = predecessor_map[current]
+                path.reverse()
+                return path
+            settled.add(closest_to_source)
+            self.settled_count += 1
+
+            distance = distance_from_source_map[closest_to_source]
+            for n in graph.get_neighbors(closest_to_source):
+                alternative_distance = distance + graph.get_edge_weight_between(closest_to_source, n)
+                if alternative_distance < distance_from_source_map.get(n, graph.INFINITY):
+                    distance_from_source_map[n] = alternative_distance
+                    predecessor_map[n] = closest_to_source
+                    heapq.heappush(heap, (alternative_distance + heuristic(n, target), next(counter), n))
+        return []
@@ -0,0 +1,114 @@
+import heapq
+import itertools
+
+
+class BidirectionalDijkstra:
+    """
+    Computes shortest paths between two vertices by running Dijkstra's algorithm forward from the source
+    and backward from the target at the same time. The forward search follows the edges of the graph,
+    while the backward search follows them in reverse through an index of incoming edges, which is
+    built on the first query of a graph and reused by the following queries.
+
+    Each step settles one vertex of the search whose closest unsettled vertex is nearer, and every
+    relaxed edge reaching a vertex seen by the other search yields a candidate path. Once the nearest
+    unsettled distances of both searches add up to at least the shortest candidate, no shorter path
+    can exist. Both searches then only explored balls of about half the radius of a unidirectional search.
+    """
+
+    def __init__(self):
+        self.graph = None  # Graph whose incoming edges are indexed
+        self.reverse_adjacency = {}  # Maps each vertex to the (source, weight) pairs of its incoming edges
+        self.settled_count = 0  # Number of vertices settled by both searches during the last query
+
+    def build_reverse_index(self, graph):
+        """
+        Indexes the incoming edges of every vertex of a graph.
+
+        :param graph: The graph whose edges are indexed.
+        """
+        reverse_adjacency = {v: [] for v in graph.get_vertices()}
+        for v in reverse_adjacency:
+            for n in graph.get_neighbors(v):
+                reverse_adjacency[n].append((v, graph.get_edge_weight_between(v, n)))
+        self.graph = graph
+        self.reverse_adjacency = reverse_adjacency
+
+    def shortest_path(self, graph, source, target):
+        """
+        Computes the shortest path between two vertices.
+
+        :param graph: The graph on which to compute the path.
+        :param source: The source vertex of the path.
+        :param target: The target vertex of the path.
+        :return: A list of vertices representing the shortest path, or an empty list if the target is unreachable.
+        """
+        if not graph.has_vertex(source):
+            raise ValueError("Source vertex is not in the graph")
+        if not graph.has_vertex(target):
+            raise ValueError("Target vertex is not in the graph")
+        if graph is not self.graph:
+            self.build_reverse_index(graph)
+        self.settled_count = 0
+        if source == target:
+            return [source]
+
+        reverse_adjacency = self.reverse_adjacency
+        counter = itertools.count()  # Breaks distance ties, since vertices are not comparable
+        forward_distances, backward_distances = {source: 0}, {target: 0}
+        forward_predecessors, backward_successors = {source: None}, {target: None}
+        forward_settled, backward_settled = set(), set()
+        forward_heap, backward_heap = [(0, next(counter), source)], [(0, next(counter), target)]
+        best_distance = graph.INFINITY
+        meeting_vertex = None
+
+        while forward_heap and backward_heap:
+            if forward_heap[0][0] + backward_heap[0][0] >= best_distance:
+                break  # Any path through unsettled vertices is at least as long as the best one
+            is_forward = forward_heap[0][0] <= backward_heap[0][0]
+            if is_forward:
+                heap, distances, links = forward_heap, forward_distances, forward_predecessors
+                settled, other_distances = forward_settled, backward_distances
+            else:
+                heap, distances, links = backward_heap, backward_distances, backward_successors
+                settled, other_distances = backward_settled, forward_distances
+
+            distance, _, closest = heapq.heappop(heap)
+            if closest in settled:
+                continue  # Outdated entry of a vertex reached again with a shorter distance
+            settled.add(closest)
+            self.settled_count += 1
+
+            if is_forward:
+                edges = ((n, graph.get_edge_weight_between(closest, n)) for n in graph.get_neighbors(closest))
+            else:
+                edges = reverse_adjacency[closest]
+            for n, weight in edges:
+                alternative_distance = distance + weight
+                if alternative_distance < distances.get(n, graph.INFINITY):
+                    distances[n] = alternative_distance
+                    links[n] = closest
+                    heapq.heappush(heap, (alternative_distance, next(counter), n))
+                if n in other_distances and distances[n] + other_distances[n] < best_distance:
+                    best_distance = distances[n] + other_distances[n]
+                    meeting_vertex = n
+
+        if meeting_vertex is None:
+            return []
+        path = []
+        current = meeting_vertex
+        while current is not None:
+            path.append(current)
+            current = forward_predecessors[current]
+        path.reverse()
+        current = backward_successors[meeting_vertex]
+        while current is not None:
+            path.append(current)
+            current = backward_successors[current]
+        return path
+
+    def reset_state(self):
+        """
+        Drops the index of incoming edges. It must be reset after the edges of the indexed graph change.
+        """
+        self.graph = None
+        self.reverse_adjacency = {}
@@ -0,0 +1,269 @@
+import heapq
+import itertools
+import json
+import math
+
+from graph.vertex import Vertex
+
+# Vertices a witness search may settle before giving up. A search giving up early only adds
+# a shortcut that may be superfluous, which never makes queries wrong.
+WITNESS_SETTLE_LIMIT = 64
+FORMAT_VERSION = 1
+
+
+class ContractionHierarchy:
+    """
+    Answers shortest path queries on a static graph with contraction hierarchies.
+
+    Preprocessing contracts the vertices one at a time, least important first. Contracting a vertex
+    removes it from the remaining graph, and adds a shortcut edge between two of its neighbors whenever
+    the path through it is the only shortest one, which a bounded Dijkstra search for another path,
+    called a witness, tells. The importance of a vertex is its edge difference, the number of shortcuts
+    its contraction adds minus the number of edges it removes, plus the number of its neighbors already
+    contracted, which spreads contractions evenly over the graph. Importances are updated lazily when
+    the least important vertex is about to be contracted.
+
+    Every shortest path then has a form climbing to higher ranked vertices and going down again, so
+    queries run a bidirectional Dijkstra search following only edges leading to higher ranked vertices,
+    which settles few vertices. Shortcuts remember the vertex they bypass, which lets paths be unpacked
+    into the vertices of the original graph.
+    """
+
+    def __init__(self, vertices, ranks, forward_edges, backward_edges, shortcut_middles):
+        """
+        Creates a hierarchy from its preprocessed data. Vertices are numbered by their position in `vertices`.
+
+        :param vertices: the vertices of the graph
+        :param ranks: the contraction order of each vertex
+        :param forward_edges: for each vertex, the (vertex, weight) pairs of its edges to higher ranked vertices
+        :param backward_edges: for each vertex, the (vertex, weight) pairs of the edges reaching it from
+        higher ranked vertices
+        :param shortcut_middles: a dictionary mapping the (source, destination) pair of each shortcut
+        to the vertex it bypasses
+        """
+        self.vertices = vertices
+        self.indices_map = {v: i for i, v in enumerate(vertices)}
+        self.ranks = ranks
+        self.forward_edges = forward_edges
+        self.backward_edges = backward_edges
+        self.shortcut_middles = shortcut_middles
+        self.settled_count = 0  # Number of vertices settled by both searches during the last query
+
+    @classmethod
+    def build(cls, graph):
+        """
+        Preprocesses a graph into a contraction hierarchy.
+
+        :param graph: the graph to preprocess, typically a DijkstraListGraph
+        :return: the contraction hierarchy of the graph
+        """
+        vertices = graph.get_vertices()
+        indices_map = {v: i for i, v in enumerate(vertices)}
+        # Edges of the remaining graph, as dictionaries from neighbor to weight
+        out_edges = [{} for _ in vertices]
+        in_edges = [{} for _ in vertices]
+        for i, v in enumerate(vertices):
+            for n in graph.get_neighbors(v):
+                j = indices_map[n]
+                weight = graph.get_edge_weight_between(v, n)
+                if weight < out_edges[i].get(j, math.inf):
+                    out_edges[i][j] = weight
+                    in_edges[j][i] = weight
+
+        def find_witness_distances(source, excluded, max_distance):
+            """
+            Computes distances from a source in the remaining graph without a given vertex,
+            up to a maximum distance and WITNESS_SETTLE_LIMIT settled vertices
+            """
+            distances = {source: 0}
+            settled = set()
+            heap = [(0, source)]
+            while heap and len(settled) < WITNESS_SETTLE_LIMIT:
+                distance, closest = heapq.heappop(heap)
+                if distance > max_distance:
+                    break
+                if closest in settled:
+                    continue
+                settled.add(closest)
+                for n, weight in out_edges[closest].items():
+                    alternative_distance = distance + weight
+                    if n != excluded and alternative_distance < distances.get(n, math.inf):
+                        distances[n] = alternative_distance
+                        heapq.heappush(heap, (alternative_distance, n))
+            return distances
+
+        def find_shortcuts(v):
+            """
+            Lists the (source, destination, weight) shortcuts needed to contract a vertex
+            """
+            shortcuts = []
+            for u, in_weight in in_edges[v].items():
+                via_distances = {w: in_weight + out_weight for w, out_weight in out_edges[v].items() if w != u}
+                if not via_distances:
+                    continue
+                witness_distances = find_witness_distances(u, v, max(via_distances.values()))
+                for w, via_distance in via_distances.items():
+                    if witness_distances.get(w, math.inf) > via_distance:
+                        shortcuts.append((u, w, via_distance))
+            return shortcuts
+
+        contracted_neighbor_counts = [0] * len(vertices)
+
+        def compute_importance(v, shortcuts):
+            return len(shortcuts) - len(in_edges[v]) - len(out_edges[v]) + contracted_neighbor_counts[v]
+
+        heap = [(compute_importance(v, find_shortcuts(v)), v) for v in range(len(vertices))]
+        heapq.heapify(heap)
+        ranks = [0] * len(vertices)
+        forward_edges = [[] for _ in vertices]
+        backward_edges = [[] for _ in vertices]
+        shortcut_middles = {}
+        for rank in range(len(vertices)):
+            while True:
+                _, v = heapq.heappop(heap)
+                shortcuts = find_shortcuts(v)
+                importance = compute_importance(v, shortcuts)
+                if not heap or importance <= heap[0][0]:
+                    break
+                heapq.heappush(heap, (importance, v))  # Outdated importance, try the next vertex
+
+            ranks[v] = rank
+            # The remaining neighbors are all contracted later, so the edges to them lead upwards
+            forward_edges[v] = list(out_edges[v].items())
+            backward_edges[v] = list(in_edges[v].items())
+            for u in in_edges[v]:
+                del out_edges[u][v]
+            for w in out_edges[v]:
+                del in_edges[w][v]
+            for n in in_edges[v].keys() | out_edges[v].keys():
+                contracted_neighbor_counts[n] += 1
+            out_edges[v].clear()
+            in_edges[v].clear()
+            for u, w, weight in shortcuts:
+                if weight < out_edges[u].get(w, math.inf):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    shortcut_middles[(u, w)] = v
+        return cls(vertices, ranks, forward_edges, backward_edges, shortcut_middles)
+
+    def shortest_path(self, source, target):
+        """
+        Computes the shortest path between two vertices.
+
+        :param source: The source vertex of the path.
+        :param target: The target vertex of the path.
+        :return: A list of vertices representing the shortest path, or an empty list if the target is unreachable.
+        """
+        source_index = self.indices_map.get(source)
+        target_index = self.indices_map.get(target)
+        if source_index is None:
+            raise ValueError("Source vertex is not in the graph")
+        if target_index is None:
+            raise ValueError("Target vertex is not in the graph")
+
+        counter = itertools.count()
+        forward_distances, backward_distances = {source_index: 0}, {target_index: 0}
+        forward_predecessors, backward_successors = {source_index: None}, {target_index: None}
+        forward_settled, backward_settled = set(), set()
+        forward_heap, backward_heap = [(0, next(counter), source_index)], [(0, next(counter), target_index)]
+        best_distance = math.inf
+        meeting_index = None
+        self.settled_count = 0
+
+        while True:
+            # Each search goes on until its closest unsettled vertex is not closer than the best path
+            forward_open = forward_heap and forward_heap[0][0] < best_distance
+            backward_open = backward_heap and backward_heap[0][0] < best_distance
+            if not forward_open and not backward_open:
+                break
+            if forward_open and (not backward_open or forward_heap[0][0] <= backward_heap[0][0]):
+                heap, distances, links = forward_heap, forward_distances, forward_predecessors
+                settled, edges, other_distances = forward_settled, self.forward_edges, backward_distances
+            else:
+                heap, distances, links = backward_heap, backward_distances, backward_successors
+                settled, edges, other_distances = backward_settled, self.backward_edges, forward_distances
+
+            distance, _, closest = heapq.heappop(heap)
+            if closest in settled:
+                continue
+            settled.add(closest)
+            self.settled_count += 1
+            if closest in other_distances and distance + other_distances[closest] < best_distance:
+                best_distance = distance + other_distances[closest]
+                meeting_index = closest
+            for n, weight in edges[closest]:
+                alternative_distance = distance + weight
+                if alternative_distance < distances.get(n, math.inf):
+                    distances[n] = alternative_distance
+                    links[n] = closest
+                    heapq.heappush(heap, (alternative_distance, next(counter), n))
+
+        if meeting_index is None:
+            return []
+        hierarchy_path = []
+        current = meeting_index
+        while current is not None:
+            hierarchy_path.append(current)
+            current = forward_predecessors[current]
+        hierarchy_path.reverse()
+        current = backward_successors[meeting_index]
+        while current is not None:
+            hierarchy_path.append(current)
+            current = backward_successors[current]
+
+        path = [hierarchy_path[0]]
+        for u, w in zip(hierarchy_path, hierarchy_path[1:]):
+            self.unpack_edge(u, w, path)
+        return [self.vertices[i] for i in path]
+
+    def unpack_edge(self, source, destination, path):
+        """
+        Appends to a path the vertices of the original graph that an edge of the hierarchy leads
+        through, up to its destination, replacing every shortcut by the two edges it bypasses.
+        """
+        stack = [(source, destination)]
+        while stack:
+            u, w = stack.pop()
+            middle = self.shortcut_middles.get((u, w))
+            if middle is None:
+                path.append(w)
+            else:
+                stack.append((middle, w))
+                stack.append((u, middle))
+
+    def save(self, path):
+        """
+        Writes the hierarchy to a JSON file, where vertices are identified by their labels
+
+        :param path: the path of the file
+        """
+        data = {
+            'format_version': FORMAT_VERSION,
+            'labels': [v.label for v in self.vertices],
+            'ranks': self.ranks,
+            'forward_edges': self.forward_edges,
+            'backward_edges': self.backward_edges,
+            'shortcut_middles': [[u, w, middle] for (u, w), middle in self.shortcut_middles.items()],
+        }
+        with open(path, 'w') as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a hierarchy written by save. Its vertices are equal to those of the preprocessed graph.
+
+        :param path: the path of the file
+        :return: the contraction hierarchy
+        """
+        with open(path) as file:
+            data = json.load(file)
+        if data.get('format_version') != FORMAT_VERSION:
+            raise ValueError("Unsupported contraction hierarchy file format")
+        return cls(
+            [Vertex(label) for label in data['labels']],
+            data['ranks'],
+            [[(w, weight) for w, weight in edges] for edges in data['forward_edges']],
+            [[(u, weight) for u, weight in edges] for edges in data['backward_edges']],
+            {(u, w): middle for u, w, middle in data['shortcut_middles']},
+        )
@@ -1,4 +1,7 @@
-from graph.dijkstra.vertex_distance_priority_queue import VertexDistancePriorityQueue
+import heapq
+import itertools
+
+from graph.dijkstra.indexed_vertex_priority_queue import IndexedVertexPriorityQueue
 
 
 class DijkstraAlgorithm:
@@ -8,8 +11,16 @@ class DijkstraAlgorithm:
     with non-negative edge weights.
     """
 
-    def __init__(self):
+    def __init__(self, priority_queue_class=IndexedVertexPriorityQueue):
+        """
+        :param priority_queue_class: the class of the priority queue ordering the vertices by distance,
+        constructed with the number of vertices and providing add, poll_smallest, update and is_empty.
+        The default indexed heap makes a run take O((V + E) log V) time, while the sorted-list
+        VertexDistancePriorityQueue takes O(V^2).
+        """
+        self.priority_queue_class = priority_queue_class
         self.predecessor_map = {}
+        self.settled_count = 0  # Number of vertices settled by the last shortest_path query
 
     def compute_paths(self, graph, source):
         """
@@ -22,7 +33,7 @@ class DijkstraAlgorithm:
             raise ValueError("Source vertex is not in the graph")
 
         distance_from_source_map = {}
-        p_queue = VertexDistancePriorityQueue(graph.get_vertex_count())
+        p_queue = self.priority_queue_class(graph.get_vertex_count())
 
         vertices = graph.get_vertices()
         for v in vertices:
@@ -33,17 +44,65 @@ class DijkstraAlgorithm:
 
         while not p_queue.is_empty():
             closest_to_source = p_queue.poll_smallest()
+            closest_distance = distance_from_source_map[closest_to_source]
             neighbors = graph.get_neighbors(closest_to_source)
 
             for n in neighbors:
                 current_distance = distance_from_source_map[n]
                 edge_weight = graph.get_edge_weight_between(closest_to_source, n)
-                alternative_distance = distance_from_source_map[closest_to_source] + edge_weight
+                alternative_distance = closest_distance + edge_weight
                 if alternative_distance < current_distance:
                     p_queue.update(n, alternative_distance)
                     distance_from_source_map[n] = alternative_distance
                     self.predecessor_map[n] = closest_to_source
 
+    def shortest_path(self, graph, source, target):
+        """
+        Computes the shortest path between two vertices, only exploring the vertices closer to the
+        source than the target. Vertices enter the heap when they are discovered rather than all
+        up front, a vertex whose distance decreases is pushed again instead of being updated, and
+        the outdated heap entries are skipped when polled. The search stops as soon as the target
+        is settled. The predecessors stored by compute_paths are left untouched.
+
+        :param graph: The graph on which to compute the path.
+        :param source: The source vertex of the path.
+        :param target: The target vertex of the path.
+        :return: A list of vertices representing the shortest path, or an empty list if the target is unreachable.
+        """
+        if not graph.has_vertex(source):
+            raise ValueError("Source vertex is not in the graph")
+        if not graph.has_vertex(target):
+            raise ValueError("Target vertex is not in the graph")
+
+        distance_from_source_map = {source: 0}
+        predecessor_map = {source: None}
+        settled = set()
+        counter = itertools.count()  # Breaks distance ties, since vertices are not comparable
+        heap = [(0, next(counter), source)]
+        self.settled_count = 0
+        while heap:
+            distance, _, closest_to_source = heapq.heappop(heap)
+            if closest_to_source in settled:
+                continue  # Outdated entry of a vertex reached again with a shorter distance
+            if closest_to_source == target:
+                path = []
+                current = target
+                while current is not None:
+                    path.append(current)
+                    current = predecessor_map[current]
+                path.reverse()
+                return path
+            settled.add(closest_to_source)
+            self.settled_count += 1
+
+            for n in graph.get_neighbors(closest_to_source):
+                alternative_distance = distance + graph.get_edge_weight_between(closest_to_source, n)
+                if alternative_distance < distance_from_source_map.get(n, graph.INFINITY):
+                    distance_from_source_map[n] = alternative_distance
+                    predecessor_map[n] = closest_to_source
+                    heapq.heappush(heap, (alternative_distance, next(counter), n))
+        return []
+
     def get_shortest_path_to(self, target):
         """
         Retrieves the shortest path from the source vertex
@@ -0,0 +1,109 @@
+import random
+import time
+
+from graph.dijkstra.a_star_search import (AStarSearch, LandmarkHeuristic, euclidean_heuristic,
+                                          manhattan_heuristic)
+from graph.dijkstra.bidirectional_dijkstra import BidirectionalDijkstra
+from graph.dijkstra.contraction_hierarchy import ContractionHierarchy
+from graph.dijkstra.dijkstra_algorithm import DijkstraAlgorithm
+from graph.dijkstra.graph.dijkstra_list_graph import DijkstraListGraph
+from graph.dijkstra.graph.dijkstra_matrix_graph import DijkstraMatrixGraph
+from graph.vertex import Vertex
+
+
+def create_grid_graph(graph, side, rng):
+    """
+    Fills a graph with a road-like grid of side * side vertices, each connected to its
+    horizontal and vertical neighbors in both directions. Every edge weighs between 1 and 3
+    times its unit length, so distances between coordinates never overestimate path lengths.
+
+    :return: the graph and a dictionary mapping every vertex to its (x, y) coordinates
+    """
+    coordinates = {}
+    grid = [[Vertex(f"{x},{y}") for y in range(side)] for x in range(side)]
+    for x, column in enumerate(grid):
+        for y, vertex in enumerate(column):
+            graph.add_vertex(vertex)
+            coordinates[vertex] = (x, y)
+    for x in range(side):
+        for y in range(side):
+            for neighbor_x, neighbor_y in ((x + 1, y), (x, y + 1)):
+                if neighbor_x < side and neighbor_y < side:
+                    graph.set_edge(grid[x][y], grid[neighbor_x][neighbor_y], rng.uniform(1, 3))
+                    graph.set_edge(grid[neighbor_x][neighbor_y], grid[x][y], rng.uniform(1, 3))
+    return graph, coordinates
+
+
+def benchmark_point_to_point(graph, coordinates, query_count, rng):
+    """
+    Compares the settled vertices and the latency of point-to-point queries between random vertices
+    for Dijkstra's algorithm, its bidirectional variant and A* with each heuristic.
+    """
+    vertices = graph.get_vertices()
+    queries = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(query_count)]
+
+    start = time.perf_counter_ns()
+    landmark_heuristic = LandmarkHeuristic(graph, landmark_count=8)
+    print(f"Landmark preprocessing: {(time.perf_counter_ns() - start) / 1e6:.0f} ms")
+
+    searches = {
+        "Dijkstra": DijkstraAlgorithm(),
+        "Bidirectional": BidirectionalDijkstra(),
+        "A* Euclidean": AStarSearch(euclidean_heuristic(coordinates)),
+        "A* Manhattan": AStarSearch(manhattan_heuristic(coordinates)),
+        "A* landmarks": AStarSearch(landmark_heuristic),
+    }
+    print(f"{'Search':<16}{'settled':>10}{'ms/query':>10}")
+    for name, search in searches.items():
+        search.shortest_path(graph, vertices[0], vertices[0])  # Builds the reverse index of the bidirectional search
+        settled_count = 0
+        start = time.perf_counter_ns()
+        for source, target in queries:
+            search.shortest_path(graph, source, target)
+            settled_count += search.settled_count
+        query_ms = (time.perf_counter_ns() - start) / 1e6 / query_count
+        print(f"{name:<16}{settled_count / query_count:>10.0f}{query_ms:>10.2f}")
+
+
+def benchmark_contraction_hierarchy(graph, query_count, rng):
+    """
+    Compares the settled vertices and the latency of point-to-point queries between random vertices
+    for Dijkstra's algorithm and a contraction hierarchy, reporting the preprocessing time of the latter.
+    """
+    vertices = graph.get_vertices()
+    queries = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(query_count)]
+
+    start = time.perf_counter_ns()
+    hierarchy = ContractionHierarchy.build(graph)
+    print(f"Contraction: {(time.perf_counter_ns() - start) / 1e6:.0f} ms, "
+          f"{len(hierarchy.shortcut_middles)} shortcuts")
+
+    dijkstra_algorithm = DijkstraAlgorithm()
+    # Each search is paired with the object whose settled_count it updates
+    searches = {
+        "Dijkstra": (lambda source, target: dijkstra_algorithm.shortest_path(graph, source, target),
+                     dijkstra_algorithm),
+        "Hierarchy": (hierarchy.shortest_path, hierarchy),
+    }
+    print(f"{'Search':<16}{'settled':>10}{'ms/query':>10}")
+    for name, (search, counter) in searches.items():
+        settled_count = 0
+        start = time.perf_counter_ns()
+        for source, target in queries:
+            search(source, target)
+            settled_count += counter.settled_count
+        query_ms = (time.perf_counter_ns() - start) / 1e6 / query_count
+        print(f"{name:<16}{settled_count / query_count:>10.0f}{query_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    random_generator = random.Random(0)
+    print("List graph, 150 x 150 grid")
+    list_graph, list_coordinates = create_grid_graph(DijkstraListGraph(), 150, random_generator)
+    benchmark_point_to_point(list_graph, list_coordinates, 50, random_generator)
+    print()
+    benchmark_contraction_hierarchy(list_graph, 50, random_generator)
+    print()
+    print("Matrix graph, 30 x 30 grid")
+    matrix_graph, matrix_coordinates = create_grid_graph(DijkstraMatrixGraph(30 * 30), 30, random_generator)
+    benchmark_point_to_point(matrix_graph, matrix_coordinates, 50, random_generator)
@@ -45,6 +45,16 @@ class DijkstraGraph(WeightedGraph):
         """
         pass
 
+    def has_vertex(self, vertex) -> bool:
+        """
+        Checks whether a vertex belongs to the graph. Subclasses should override this method
+        with a constant-time check, so that queries touching few vertices stay fast.
+
+        :param vertex: The vertex to look for.
+        :return: True if the vertex is in the graph, False otherwise.
+        """
+        return vertex in self.get_vertices()
+
     @abstractmethod
     def get_vertex_count(self):
         """
@@ -71,5 +71,8 @@ class DijkstraListGraph(DijkstraGraph):
                 return edge.weight
         return self.INFINITY
 
+    def has_vertex(self, vertex):
+        return vertex in self.adjacency_list
+
     def get_vertex_count(self):
         return len(self.vertices)
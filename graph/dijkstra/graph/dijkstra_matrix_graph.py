@@ -12,7 +12,7 @@ class DijkstraMatrixGraph(DijkstraGraph):
         """
         self.indices_map = {}
         self.adjacency_matrix = [[self.INFINITY for _ in range(max_vertex_count)] for _ in range(max_vertex_count)]
-        self.vertices = []
+        self.vertices = []  # Maps each index of the adjacency matrix back to its vertex
         self.max_vertices = max_vertex_count
         self.current_vertex_count = 0
 
@@ -53,15 +53,30 @@ class DijkstraMatrixGraph(DijkstraGraph):
     def get_neighbors(self, vertex):
         if vertex not in self.indices_map:
             raise ValueError("Vertex does not exist in the graph")
-        index = self.indices_map[vertex]
-        neighbors = []
-        for i in range(len(self.adjacency_matrix[index])):
-            if self.adjacency_matrix[index][i] != self.INFINITY:
-                for v, idx in self.indices_map.items():
-                    if idx == i:
-                        neighbors.append(v)
-                        break
-        return neighbors
+        vertices = self.vertices
+        return [vertices[i] for i in self.get_neighbor_indices(self.indices_map[vertex])]
+
+    def get_neighbor_indices(self, index):
+        """
+        Retrieves the indices of the vertices an edge leads to from the vertex at a given index, in O(V) time.
+
+        :param index: the index of the source vertex in the adjacency matrix
+        :return: a list of the indices of its neighbors
+        """
+        infinity = self.INFINITY
+        return [i for i, weight in enumerate(self.adjacency_matrix[index][:self.current_vertex_count])
+                if weight != infinity]
+
+    def get_vertex_by_index(self, index):
+        """
+        Retrieves the vertex at a given index of the adjacency matrix in O(1) time.
+
+        :param index: the index of the vertex
+        :return: the vertex at this index, or None if not found
+        """
+        if 0 <= index < self.current_vertex_count:
+            return self.vertices[index]
+        return None
 
     def get_edge_weight_between(self, source, destination):
         source_index = self.indices_map[source]
@@ -70,5 +85,8 @@ class DijkstraMatrixGraph(DijkstraGraph):
             return self.INFINITY
         return self.adjacency_matrix[source_index][destination_index]
 
+    def has_vertex(self, vertex):
+        return vertex in self.indices_map
+
     def get_vertex_count(self):
         return self.current_vertex_count
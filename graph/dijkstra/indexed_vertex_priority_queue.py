@@ -0,0 +1,144 @@
+class IndexedVertexPriorityQueue:
+    """
+    A priority queue for Dijkstra's algorithm implemented as an indexed d-ary min-heap.
+    The heap is stored in two parallel lists of vertices and distances, and a map from each vertex
+    to its position in the heap lets the distance of a queued vertex be updated in place.
+    Adding a vertex, polling the smallest one and updating a distance all take O(log V) time.
+
+    With an arity above 2 the heap is shallower, so adding vertices and decreasing their distances,
+    the most frequent operations of Dijkstra's algorithm, move vertices across fewer levels.
+    """
+
+    def __init__(self, max_size, arity=4):
+        """
+        Constructs a priority queue with a specified maximum size.
+
+        :param max_size: the maximum number of elements the queue can hold
+        :param arity: the number of children of each heap node
+        """
+        if max_size <= 0:
+            raise ValueError("Maximum size must be greater than 0")
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.max_size = max_size
+        self.arity = arity
+        self.vertices = []
+        self.distances = []
+        self.positions = {}  # Maps each queued vertex to its index in the heap lists
+
+    def is_empty(self):
+        """
+        Checks if the queue is empty.
+
+        :return: True if the queue has no elements, False otherwise
+        """
+        return not self.vertices
+
+    def is_full(self):
+        """
+        Checks if the queue is full.
+
+        :return: True if the queue is at maximum capacity, False otherwise
+        """
+        return len(self.vertices) == self.max_size
+
+    def contains(self, vertex):
+        """
+        Checks if a vertex is in the queue.
+
+        :param vertex: the vertex to look for
+        :return: True if the vertex is queued, False otherwise
+        """
+        return vertex in self.positions
+
+    def add(self, vertex, distance):
+        """
+        Adds a vertex along with its distance to the queue.
+
+        :param vertex: the vertex to add
+        :param distance: the distance of the vertex from the source
+        """
+        if self.is_full():
+            raise Exception("Queue is full")
+        if vertex in self.positions:
+            raise ValueError("Vertex is already in the queue")
+        self.vertices.append(vertex)
+        self.distances.append(distance)
+        self.sift_up(len(self.vertices) - 1, vertex, distance)
+
+    def poll_smallest(self):
+        """
+        Polls and returns the vertex from the queue that has the smallest distance.
+
+        :return: the vertex with the smallest distance
+        """
+        if self.is_empty():
+            raise Exception("Queue is empty")
+        smallest = self.vertices[0]
+        del self.positions[smallest]
+        last_vertex = self.vertices.pop()
+        last_distance = self.distances.pop()
+        if self.vertices:
+            self.sift_down(0, last_vertex, last_distance)
+        return smallest
+
+    def update(self, vertex, distance):
+        """
+        Updates the distance of a specific vertex in the queue.
+
+        :param vertex: the vertex whose distance needs to be updated
+        :param distance: the new distance of the vertex
+        """
+        position = self.positions.get(vertex)
+        if position is None:
+            raise ValueError("Vertex not found")
+        if distance < self.distances[position]:
+            self.sift_up(position, vertex, distance)
+        else:
+            self.sift_down(position, vertex, distance)
+
+    def sift_up(self, position, vertex, distance):
+        """
+        Places a vertex at a position or above it, moving down the ancestors with larger distances
+        """
+        vertices, distances, positions, arity = self.vertices, self.distances, self.positions, self.arity
+        while position > 0:
+            parent = (position - 1) // arity
+            parent_distance = distances[parent]
+            if parent_distance <= distance:
+                break
+            parent_vertex = vertices[parent]
+            vertices[position] = parent_vertex
+            distances[position] = parent_distance
+            positions[parent_vertex] = position
+            position = parent
+        vertices[position] = vertex
+        distances[position] = distance
+        positions[vertex] = position
+
+    def sift_down(self, position, vertex, distance):
+        """
+        Places a vertex at a position or below it, moving up the smallest children with smaller distances
+        """
+        vertices, distances, positions, arity = self.vertices, self.distances, self.positions, self.arity
+        size = len(vertices)
+        while True:
+            first_child = position * arity + 1
+            if first_child >= size:
+                break
+            smallest_child = first_child
+            smallest_distance = distances[first_child]
+            for child in range(first_child + 1, min(first_child + arity, size)):
+                if distances[child] < smallest_distance:
+                    smallest_child = child
+                    smallest_distance = distances[child]
+            if smallest_distance >= distance:
+                break
+            child_vertex = vertices[smallest_child]
+            vertices[position] = child_vertex
+            distances[position] = smallest_distance
+            positions[child_vertex] = position
+            position = smallest_child
+        vertices[position] = vertex
+        distances[position] = distance
+        positions[vertex] = position
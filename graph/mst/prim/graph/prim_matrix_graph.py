@@ -14,6 +14,7 @@ class PrimMatrixGraph(PrimGraph):
         Constructs a graph with a specified maximum number of vertices.
         """
         self.indices_map = {}
+        self.vertices = []  # Maps each index of the adjacency matrix back to its vertex
         self.adjacency_matrix = [[self.NO_EDGE for _ in range(max_vertex_count)] for _ in range(max_vertex_count)]
         self.max_vertices = max_vertex_count
         self.current_vertex_count = 0
@@ -28,6 +29,7 @@ class PrimMatrixGraph(PrimGraph):
             raise ValueError("Maximum vertices limit reached.")
         if vertex not in self.indices_map:
             self.indices_map[vertex] = self.current_vertex_count
+            self.vertices.append(vertex)
             self.current_vertex_count += 1
 
     def set_edge(self, source, destination, weight):
@@ -55,22 +57,30 @@ class PrimMatrixGraph(PrimGraph):
             raise ValueError("Vertex does not exist in the graph")
 
         index = self.indices_map[source]
-        edges = []
-        for i, weight in enumerate(self.adjacency_matrix[index]):
-            if weight != self.NO_EDGE:
-                edges.append(Edge(source, self.get_vertex_by_index(i), weight))
-        return edges
+        row = self.adjacency_matrix[index]
+        vertices = self.vertices
+        return [Edge(source, vertices[i], row[i]) for i in self.get_neighbor_indices(index)]
+
+    def get_neighbor_indices(self, index):
+        """
+        Retrieves the indices of the vertices connected to the vertex at a given index, in O(V) time.
+
+        :param index: int - The index of the vertex in the adjacency matrix.
+        :return: list - The indices of its neighbors.
+        """
+        no_edge = self.NO_EDGE
+        return [i for i, weight in enumerate(self.adjacency_matrix[index][:self.current_vertex_count])
+                if weight != no_edge]
 
     def get_vertex_by_index(self, index):
         """
-        Retrieves a vertex based on its index from a mapping of vertices to indices.
+        Retrieves a vertex based on its index in the adjacency matrix, in O(1) time.
 
         :param index: int - The index for which to find the corresponding vertex.
         :return: Vertex - The vertex associated with the given index, or None if not found.
         """
-        for vertex, idx in self.indices_map.items():
-            if idx == index:
-                return vertex
+        if 0 <= index < self.current_vertex_count:
+            return self.vertices[index]
         return None
 
     def get_vertex_count(self):
@@ -8,6 +8,7 @@ class ExplorableMatrixGraph(ExplorableGraph):
 
     def __init__(self, max_vertex_count):
         self.indices_map = {}
+        self.vertices = []  # Maps each index of the adjacency matrix back to its vertex
         self.adjacency_matrix = [[0] * max_vertex_count for _ in range(max_vertex_count)]
         self.max_vertices = max_vertex_count
         self.current_vertex_count = 0
@@ -19,6 +20,7 @@ class ExplorableMatrixGraph(ExplorableGraph):
             raise Exception("Maximum vertices limit reached.")
         if vertex not in self.indices_map:
             self.indices_map[vertex] = self.current_vertex_count
+            self.vertices.append(vertex)
             self.current_vertex_count += 1
 
     def set_edge(self, source, destination):
@@ -38,12 +40,25 @@ class ExplorableMatrixGraph(ExplorableGraph):
     def get_neighbors(self, vertex):
         if vertex not in self.indices_map:
             raise ValueError("Vertex does not exist in the graph")
-        index = self.indices_map[vertex]
-        neighbors = []
-        for i in range(len(self.adjacency_matrix[index])):
-            if self.adjacency_matrix[index][i] == 1:
-                for v, idx in self.indices_map.items():
-                    if idx == i:
-                        neighbors.append(v)
-                        break
-        return neighbors
+        vertices = self.vertices
+        return [vertices[i] for i in self.get_neighbor_indices(self.indices_map[vertex])]
+
+    def get_neighbor_indices(self, index):
+        """
+        Retrieves the indices of the vertices connected to the vertex at a given index, in O(V) time.
+
+        :param index: the index of the vertex in the adjacency matrix
+        :return: a list of the indices of its neighbors
+        """
+        return [i for i, edge in enumerate(self.adjacency_matrix[index][:self.current_vertex_count]) if edge == 1]
+
+    def get_vertex_by_index(self, index):
+        """
+        Retrieves the vertex at a given index of the adjacency matrix in O(1) time.
+
+        :param index: the index of the vertex
+        :return: the vertex at this index, or None if not found
+        """
+        if 0 <= index < self.current_vertex_count:
+            return self.vertices[index]
+        return None
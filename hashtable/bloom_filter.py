@@ -0,0 +1,96 @@
+import math
+import random
+from array import array
+
+BITS_PER_ENTRY = 10  # With the matching number of probes, about 1% of absent keys pass a full filter
+MIN_BIT_COUNT = 64
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+# Odd 64-bit multiplier spreading sequential hash codes, such as those of ints, over the whole word
+MIX_MULTIPLIER = 0x9E3779B97F4A7C15
+# Bits of the mixed hash code selecting the pattern of bits probed within a word
+PATTERN_BITS = 12
+PATTERN_MASK = (1 << PATTERN_BITS) - 1
+MAX_PROBE_COUNT = 16
+
+pattern_tables = {}  # Maps each probe count to its list of patterns, built on first use
+
+
+def get_patterns(probe_count):
+    """
+    Returns the 2^PATTERN_BITS word patterns of a probe count, each with `probe_count` distinct bits set.
+    The patterns are drawn from a generator seeded with the probe count, so every filter with the
+    same probe count shares them.
+    """
+    patterns = pattern_tables.get(probe_count)
+    if patterns is None:
+        rng = random.Random(probe_count)
+        patterns = [sum(1 << bit for bit in rng.sample(range(WORD_BITS), probe_count))
+                    for _ in range(1 << PATTERN_BITS)]
+        pattern_tables[probe_count] = patterns
+    return patterns
+
+
+class BloomFilter:
+    """
+    A blocked Bloom filter over hash codes, telling that a hash code was definitely never added,
+    or that it may have been added. The bits are stored in an array of 64-bit words.
+
+    All the bits probed for a hash code lie in a single word: the hash code is mixed once, its top bits
+    select the word and the bits below them one of a table of precomputed patterns of `probe_count` bits.
+    A lookup is then one word test instead of a loop over the probes, at the price of a slightly higher
+    false positive rate than probing bits spread over the whole filter. Bits can not be cleared, so
+    a filter only answers for hash codes added since it was created, and removals leave stale bits
+    until the filter is rebuilt.
+    """
+
+    def __init__(self, expected_count, bits_per_entry=BITS_PER_ENTRY, probe_count=None):
+        """
+        :param expected_count: the number of hash codes the filter is sized for
+        :param bits_per_entry: the number of bits per expected hash code
+        :param probe_count: the number of bits probed per hash code, by default the one
+        minimizing the false positive rate of a full filter
+        """
+        if expected_count < 1:
+            raise ValueError("Expected count must be >= 1")
+        if probe_count is None:
+            probe_count = max(1, round(bits_per_entry * math.log(2)))
+        if not 1 <= probe_count <= MAX_PROBE_COUNT:
+            raise ValueError(f"Probe count must be between 1 and {MAX_PROBE_COUNT}")
+        index_bits = max(MIN_BIT_COUNT, expected_count * bits_per_entry - 1).bit_length()
+        self.bit_count = 1 << index_bits
+        self.shift = WORD_BITS - (index_bits - 6)  # Keeps the top bits selecting one of the words
+        self.pattern_shift = self.shift - PATTERN_BITS
+        self.probe_count = probe_count
+        self.patterns = get_patterns(probe_count)
+        self.words = array('Q', bytes(self.bit_count // 8))
+
+    def add(self, hash_code):
+        """
+        Sets the bits probed for a hash code
+        """
+        mixed = hash_code * MIX_MULTIPLIER & WORD_MASK
+        self.words[mixed >> self.shift] |= self.patterns[mixed >> self.pattern_shift & PATTERN_MASK]
+
+    def might_contain(self, hash_code):
+        """
+        Checks the bits probed for a hash code, all at once.
+        :return: False if the hash code was never added, True if it may have been added
+        """
+        mixed = hash_code * MIX_MULTIPLIER & WORD_MASK
+        pattern = self.patterns[mixed >> self.pattern_shift & PATTERN_MASK]
+        return self.words[mixed >> self.shift] & pattern == pattern
+
+    def fill_ratio(self):
+        """
+        Returns the fraction of bits that are set
+        """
+        return int.from_bytes(self.words.tobytes(), 'little').bit_count() / self.bit_count
+
+    def false_positive_rate(self):
+        """
+        Estimates the probability that a hash code which was never added passes the filter. Keeping the
+        bits of a hash code in one word makes the actual rate somewhat higher than this estimate, as words
+        fill unevenly.
+        """
+        return self.fill_ratio() ** self.probe_count
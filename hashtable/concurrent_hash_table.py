@@ -0,0 +1,129 @@
+import threading
+
+from hashtable.hash_table import HashTable
+
+
+class HashTableSegment:
+    """
+    Represents one lock stripe: a hash table holding a share of the keys, guarded by its own lock.
+    The sequence number is odd while a writer modifies the table, and changes with every modification,
+    which lets readers detect that a lock-free read may have observed a partial update.
+    """
+
+    def __init__(self, capacity, hash_function_type, incremental_rehash):
+        self.table = HashTable(capacity, hash_function_type, incremental_rehash)
+        self.lock = threading.Lock()
+        self.sequence = 0
+
+
+class ConcurrentHashTable:
+    """
+    A thread-safe hash table partitioned into lock stripes. Each key belongs to one segment,
+    selected by its hash code, and each segment is an independent HashTable with its own lock.
+    Writers only lock the segment of their key, so writers of different segments do not wait for
+    each other, and a segment growing its bucket array does not block the other segments.
+
+    Readers do not take any lock. They compare the sequence number of the segment before and
+    after the lookup, and only repeat it under the lock if a writer was active in between.
+    """
+
+    def __init__(self, capacity, hash_function_type, stripe_count=16, incremental_rehash=False):
+        if capacity < 1:
+            raise ValueError("Initial capacity must be >= 1")
+        if stripe_count < 1:
+            raise ValueError("Stripe count must be >= 1")
+        segment_capacity = max(1, capacity // stripe_count)
+        self.segments = [HashTableSegment(segment_capacity, hash_function_type, incremental_rehash)
+                         for _ in range(stripe_count)]
+
+    def segment_for(self, hash_code):
+        """
+        Returns the segment responsible for a hash code.
+        Low bits select the segment, while the segment tables index their buckets with the whole hash code.
+        """
+        return self.segments[hash_code % len(self.segments)]
+
+    def put(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        :param key: the key to insert or update
+        :param value: the value associated with the key
+        """
+        segment = self.segment_for(hash(key))
+        with segment.lock:
+            segment.sequence += 1  # Odd: modification in progress
+            try:
+                segment.table.put(key, value)
+            finally:
+                segment.sequence += 1
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key without locking, unless a concurrent
+        modification of the key's segment is detected.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        hash_code = hash(key)
+        segment = self.segment_for(hash_code)
+        sequence = segment.sequence
+        if sequence % 2 == 0:
+            try:
+                # find_entry does not modify the table, unlike get, which may migrate buckets
+                entry = segment.table.find_entry(key, hash_code)
+            except Exception:
+                if segment.sequence == sequence:
+                    raise
+            else:
+                if segment.sequence == sequence:
+                    return entry.value if entry is not None else None
+        # A writer was active during the lookup, so it may have seen a partial update. The lookup is
+        # repeated with find_entry as well, since migrating buckets without bumping the sequence
+        # would relink entries under the feet of other lock-free readers.
+        with segment.lock:
+            entry = segment.table.find_entry(key, hash_code)
+            return entry.value if entry is not None else None
+
+    def remove(self, key):
+        """
+        Removes a key-value pair from the hash table.
+        :param key: the key of the pair to be removed
+        :return: True if the pair was successfully removed, False if the key was not found
+        """
+        segment = self.segment_for(hash(key))
+        with segment.lock:
+            segment.sequence += 1
+            try:
+                return segment.table.remove(key)
+            finally:
+                segment.sequence += 1
+
+    def rehash(self):
+        """
+        Doubles the size of every segment, one segment at a time, so that each segment
+        stays available while the others are being rehashed.
+        """
+        for segment in self.segments:
+            with segment.lock:
+                segment.sequence += 1
+                try:
+                    segment.table.rehash()
+                finally:
+                    segment.sequence += 1
+
+    @property
+    def size(self):
+        """
+        Returns the number of key-value pairs. While other threads modify the table,
+        the result may not reflect their latest modifications.
+        """
+        return sum(segment.table.size for segment in self.segments)
+
+    def print_hash_table(self):
+        """
+        Prints the entire contents of the hash table, segment by segment
+        """
+        for i, segment in enumerate(self.segments):
+            print(f'Segment {i}:')
+            with segment.lock:
+                segment.table.print_hash_table()
@@ -0,0 +1,228 @@
+import random
+from typing import List, Optional
+
+from hashtable.hash_table import FIBONACCI_MULTIPLIER, WORD_BITS, WORD_MASK, next_power_of_two
+
+SLOTS_PER_BUCKET = 4  # Each bucket holds several entries, which keeps insertions succeeding at high load
+STASH_SIZE = 4  # Entries that found no slot after MAX_KICKS evictions wait here until the next resize
+MAX_KICKS = 64  # Evictions tried before an insertion gives up on the bucket array
+MAX_LOAD_FACTOR = 0.9
+# A stash overflowing in a table this sparse holds keys sharing full hash codes, which no resize can separate
+SPARSE_LOAD_FACTOR = 0.125
+# Odd 64-bit multiplier of the second hash function, unrelated to the golden-ratio one of the first.
+# Both functions keep the top bits of the 64-bit product of the hash code and their multiplier.
+SECOND_MULTIPLIER = 0xC2B2AE3D27D4EB4F
+
+
+class CuckooHashTable:
+    """
+    A hash table implementation using bucketized cuckoo hashing.
+    Every key may only live in one of two buckets, chosen by two independent hash functions,
+    or in a small stash. A lookup therefore examines at most 2 * SLOTS_PER_BUCKET + STASH_SIZE
+    entries, whatever the load of the table or the distribution of the keys.
+
+    An insertion into two full buckets evicts one of their entries, which moves to its
+    alternative bucket, possibly evicting another entry in turn. Keys, their cached hash codes
+    and values are stored in parallel lists, SLOTS_PER_BUCKET consecutive slots per bucket.
+    Only keys sharing their full hash code with many others can make the stash grow beyond STASH_SIZE.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("Initial capacity must be >= 1")
+        self.allocate(next_power_of_two(-(-capacity // SLOTS_PER_BUCKET)))
+        self.size = 0  # Number of key-value pairs in the hash table
+        self.stash = []  # Entries stored as (key, hash code, value) triples
+
+    def allocate(self, bucket_count):
+        """
+        Replaces the slot lists with empty ones holding the given number of buckets
+        """
+        slot_count = bucket_count * SLOTS_PER_BUCKET
+        self.bucket_count = bucket_count
+        # Shift keeping the top bits of a 64-bit product that index one of the buckets
+        self.index_shift = WORD_BITS + 1 - bucket_count.bit_length()
+        self.keys: List = [None] * slot_count
+        self.hashes: List[Optional[int]] = [None] * slot_count  # None marks an empty slot
+        self.values: List = [None] * slot_count
+
+    def bucket_slots(self, hash_code):
+        """
+        Returns the slot ranges of the two buckets where an entry with the given hash code may live
+        """
+        first = ((hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        second = ((hash_code * SECOND_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        return range(first, first + SLOTS_PER_BUCKET), range(second, second + SLOTS_PER_BUCKET)
+
+    def find_slot(self, key, hash_code):
+        """
+        Finds the slot holding the given key.
+        :return: the slot index, or -1 if the key is not in the bucket array
+        """
+        # The buckets are computed inline, the second one only if the key is not in the first one
+        hashes, keys = self.hashes, self.keys
+        slot = ((hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        end = slot + SLOTS_PER_BUCKET
+        while slot < end:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return slot
+            slot += 1
+        slot = ((hash_code * SECOND_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        end = slot + SLOTS_PER_BUCKET
+        while slot < end:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return slot
+            slot += 1
+        return -1
+
+    def find_in_stash(self, key, hash_code):
+        """
+        Finds the position of the given key in the stash, or -1 if it is not there
+        """
+        for i, (stashed_key, stashed_hash, _) in enumerate(self.stash):
+            if stashed_hash == hash_code and stashed_key == key:
+                return i
+        return -1
+
+    def place(self, key, hash_code, value):
+        """
+        Stores an entry whose key is known to be absent in one of its buckets, evicting other entries if needed.
+        :return: None on success, or the (key, hash code, value) triple left without a slot
+        """
+        for _ in range(MAX_KICKS):
+            first, second = self.bucket_slots(hash_code)
+            for slot in (*first, *second):
+                if self.hashes[slot] is None:
+                    self.keys[slot] = key
+                    self.hashes[slot] = hash_code
+                    self.values[slot] = value
+                    return None
+            # Both buckets are full: take a random slot and move its entry on
+            slot = random.choice((first, second))[random.randrange(SLOTS_PER_BUCKET)]
+            self.keys[slot], key = key, self.keys[slot]
+            self.hashes[slot], hash_code = hash_code, self.hashes[slot]
+            self.values[slot], value = value, self.values[slot]
+        return key, hash_code, value
+
+    def put(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        :param key: the key to insert or update
+        :param value: the value associated with the key
+        """
+        hash_code = hash(key)
+        slot = self.find_slot(key, hash_code)
+        if slot >= 0:
+            # Key found, update value
+            self.values[slot] = value
+            return
+        position = self.find_in_stash(key, hash_code)
+        if position >= 0:
+            self.stash[position] = (key, hash_code, value)
+            return
+
+        if (self.size + 1) / len(self.hashes) > MAX_LOAD_FACTOR:
+            self.rehash()
+        homeless = self.place(key, hash_code, value)
+        self.size += 1
+        if homeless is not None:
+            self.stash.append(homeless)
+            if len(self.stash) > STASH_SIZE and self.size / len(self.hashes) >= SPARSE_LOAD_FACTOR:
+                self.rehash()
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        # Inlined find_slot, saving a call on the hottest path
+        hash_code = hash(key)
+        hashes, keys = self.hashes, self.keys
+        slot = ((hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        end = slot + SLOTS_PER_BUCKET
+        while slot < end:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return self.values[slot]
+            slot += 1
+        slot = ((hash_code * SECOND_MULTIPLIER & WORD_MASK) >> self.index_shift) * SLOTS_PER_BUCKET
+        end = slot + SLOTS_PER_BUCKET
+        while slot < end:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return self.values[slot]
+            slot += 1
+        for stashed_key, stashed_hash, value in self.stash:
+            if stashed_hash == hash_code and stashed_key == key:
+                return value
+        return None
+
+    def remove(self, key):
+        """
+        Removes a key-value pair from the hash table.
+        :param key: the key of the pair to be removed
+        :return: True if the pair was successfully removed, False if the key was not found
+        """
+        hash_code = hash(key)
+        slot = self.find_slot(key, hash_code)
+        if slot >= 0:
+            self.keys[slot] = None
+            self.hashes[slot] = None
+            self.values[slot] = None
+            self.size -= 1
+            self.unstash()
+            return True
+        position = self.find_in_stash(key, hash_code)
+        if position >= 0:
+            self.stash.pop(position)
+            self.size -= 1
+            return True
+        return False
+
+    def unstash(self):
+        """
+        Moves stashed entries back into the bucket array when one of their buckets has a free slot
+        """
+        for i in range(len(self.stash) - 1, -1, -1):
+            key, hash_code, value = self.stash[i]
+            first, second = self.bucket_slots(hash_code)
+            for slot in (*first, *second):
+                if self.hashes[slot] is None:
+                    self.keys[slot] = key
+                    self.hashes[slot] = hash_code
+                    self.values[slot] = value
+                    self.stash.pop(i)
+                    break
+
+    def rehash(self):
+        """
+        Doubles the number of buckets and reinserts all existing entries using their cached hash codes.
+        If the stash overflows again, the number of buckets is doubled again, unless the table is already
+        so sparse that the overflow comes from keys sharing hash codes.
+        """
+        entries = [(key, hash_code, value)
+                   for key, hash_code, value in zip(self.keys, self.hashes, self.values) if hash_code is not None]
+        entries.extend(self.stash)
+        bucket_count = self.bucket_count * 2
+        while True:
+            self.allocate(bucket_count)
+            self.stash = []
+            for key, hash_code, value in entries:
+                homeless = self.place(key, hash_code, value)
+                if homeless is not None:
+                    self.stash.append(homeless)
+            if len(self.stash) <= STASH_SIZE or len(entries) / len(self.hashes) < SPARSE_LOAD_FACTOR:
+                return
+            bucket_count *= 2
+
+    def print_hash_table(self):
+        """
+        Prints the entire contents of the hash table
+        """
+        for bucket in range(self.bucket_count):
+            print(f'[{bucket}]', end='')
+            for slot in range(bucket * SLOTS_PER_BUCKET, (bucket + 1) * SLOTS_PER_BUCKET):
+                if self.hashes[slot] is not None:
+                    print(f'|{self.keys[slot]}, {self.values[slot]}|', end='')
+            print()  # For newline
+        if self.stash:
+            print('[stash]', ''.join(f'|{key}, {value}|' for key, _, value in self.stash))
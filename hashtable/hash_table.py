@@ -1,8 +1,20 @@
+import bisect
+import gc
+import itertools
 import math
+import operator
+import pickle
+import struct
+import sys
+import time
+from array import array
 from decimal import Decimal, getcontext
 from enum import Enum
 from typing import List, Optional
 
+from binary_tree.bst.red_black.red_black_tree import RedBlackTree
+from hashtable.bloom_filter import BloomFilter
+
 # Set the precision to accommodate large hash codes
 getcontext().prec = 50
 
@@ -12,9 +24,13 @@ class HashTableEntry:
     Represents a key-value pair in the hash table
     """
 
-    def __init__(self, key, value):
+    __slots__ = ('key', 'value', 'hash_code', 'next')
+
+    def __init__(self, key, value, hash_code=None):
         self.key = key
         self.value = value
+        # Full hash code of the key, cached so that resizing and lookups do not recompute it
+        self.hash_code = hash(key) if hash_code is None else hash_code
         self.next = None  # Reference to the next entry (node) in the linked list
 
 
@@ -25,49 +41,96 @@ class HashTableBucket:
 
     def __init__(self):
         self.head = None  # Head of the linked list
+        self.length = 0  # Number of entries in the list
 
-    def insert_at_beginning(self, key, value):
+    def __iter__(self):
+        """
+        Iterates over the entries of the list. The next entry is read before an entry is
+        yielded, so the yielded entry may be relinked into another bucket.
+        """
+        current = self.head
+        while current is not None:
+            next_entry = current.next
+            yield current
+            current = next_entry
+
+    def insert_at_beginning(self, key, value, hash_code=None):
         """
         Inserts a new entry at the beginning of the list
         :param key: The key of the entry to be inserted.
         :param value: The value of the entry.
+        :param hash_code: The hash code of the key, computed from the key if omitted.
+        """
+        self.insert_entry(HashTableEntry(key, value, hash_code))
+
+    def insert_entry(self, entry):
         """
-        new_entry = HashTableEntry(key, value)
-        new_entry.next = self.head
-        self.head = new_entry
+        Links an existing entry at the beginning of the list
+        :param entry: The entry to be linked.
+        """
+        entry.next = self.head
+        self.head = entry
+        self.length += 1
 
-    def delete(self, key):
+    def delete(self, key, hash_code=None):
         """
         Deletes an entry with the specified key from the list
         :param key: The key of the entry to be deleted.
+        :param hash_code: The hash code of the key, computed from the key if omitted.
         :return: True if the entry was found and successfully deleted, False otherwise.
         """
+        if hash_code is None:
+            hash_code = hash(key)
         current = self.head
         prev = None
 
         while current is not None:
-            if current.key == key:
+            # Comparing the cached hash codes first avoids most calls to a potentially expensive __eq__
+            if current.hash_code == hash_code and current.key == key:
                 # Key found, delete the entry
                 if prev is None:
                     self.head = current.next  # Deleting the first entry
                 else:
                     prev.next = current.next  # Deleting a subsequent entry
+                self.length -= 1
                 return True  # Entry successfully deleted
             prev = current
             current = current.next
         return False  # Key not found
 
-    def find(self, key):
+    def find_with_probes(self, key, hash_code):
+        """
+        Finds an entry by key in the list and counts the entries examined on the way
+        :return: the entry, or None if the key is not found, and the number of examined entries
+        """
+        probes = 0
+        current = self.head
+        while current is not None:
+            probes += 1
+            if current.hash_code == hash_code and current.key == key:
+                return current, probes
+            current = current.next
+        return None, probes
+
+    def find(self, key, hash_code=None):
         """
         Finds an entry by key in the list
         """
+        if hash_code is None:
+            hash_code = hash(key)
         current = self.head
         while current is not None:
-            if current.key == key:
+            if current.hash_code == hash_code and current.key == key:
                 return current
             current = current.next
         return None  # Return None if key not found
 
+    def chain_length(self):
+        """
+        Returns the number of entries in the list
+        """
+        return self.length
+
     def print_bucket(self):
         """
         Prints all the entries in this hash table bucket.
@@ -79,9 +142,266 @@ class HashTableBucket:
         print()  # For newline
 
 
+class TreeBinKey:
+    """
+    Orders the entries of a treeified bucket by hash code, then by key, then by insertion sequence.
+    The sequence breaks ties between unequal keys neither of which is smaller than the other,
+    so that no two entries of a tree ever compare as duplicates.
+    """
+
+    __slots__ = ('hash_code', 'key', 'entry', 'sequence')
+
+    def __init__(self, hash_code, key, entry, sequence):
+        self.hash_code = hash_code
+        self.key = key
+        self.entry = entry  # The hash table entry this tree key stands for
+        self.sequence = sequence  # Insertion sequence of the entry in its tree
+
+    def __eq__(self, other):
+        return self.hash_code == other.hash_code and self.key == other.key
+
+    def __lt__(self, other):
+        if self.hash_code != other.hash_code:
+            return self.hash_code < other.hash_code
+        if self.key < other.key:
+            return True
+        if self.key > other.key:
+            return False
+        return self.sequence < other.sequence
+
+    def __gt__(self, other):
+        return other < self
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.key)
+
+
+def is_orderable_type(key_type):
+    """
+    Checks whether the instances of a type define an ordering usable in a tree bucket.
+    Sets are excluded, as their ordering by inclusion is only partial: incomparable sets
+    would not keep a consistent position in the tree.
+    """
+    return key_type.__lt__ is not object.__lt__ and not issubclass(key_type, (set, frozenset))
+
+
+class HashTableTreeBucket:
+    """
+    Represents a bucket whose entries are kept in a red-black tree ordered as their TreeBinKey.
+    A chain is converted into this form once it grows beyond TREEIFY_THRESHOLD entries, so that
+    lookups in heavily colliding buckets take logarithmic instead of linear time.
+    All keys of the tree share one type, so they can be ordered against each other. Their ordering
+    must be a total preorder: unequal keys may tie, as with objects ordered by one of their fields,
+    but must not be incomparable the way sets are. Lookups search both sides of a tie.
+    """
+
+    def __init__(self, key_type):
+        self.tree = RedBlackTree()
+        self.key_type = key_type
+        self.length = 0  # Number of entries in the tree
+        self.sequence = itertools.count()  # Breaks ties between unequal keys
+
+    @classmethod
+    def from_chain(cls, bucket):
+        """
+        Builds a tree bucket holding the entries of a chain.
+        :return: the tree bucket, or None if the keys of the chain cannot be ordered against each other
+        """
+        entries = list(bucket)
+        key_type = type(entries[0].key)
+        if not is_orderable_type(key_type) or any(type(entry.key) is not key_type for entry in entries):
+            return None
+        tree_bucket = cls(key_type)
+        for entry in entries:
+            if not tree_bucket.try_insert_entry(entry):
+                return None
+        return tree_bucket
+
+    def to_chain(self):
+        """
+        Converts the tree back into a linked list bucket holding the same entries
+        """
+        bucket = HashTableBucket()
+        for entry in self:
+            bucket.insert_entry(entry)
+        return bucket
+
+    def __iter__(self):
+        """
+        Iterates over the entries of the tree in order
+        """
+        return (tree_key.entry for tree_key in self.tree_keys())
+
+    def tree_keys(self):
+        """
+        Iterates over the tree keys in order
+        """
+        stack = []
+        node = self.tree.get_root()
+        node = None if node.is_sentinel else node
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.get_left()
+            else:
+                node = stack.pop()
+                yield node.key
+                node = node.get_right()
+
+    def try_insert_entry(self, entry):
+        """
+        Inserts an existing entry into the tree.
+        :param entry: The entry to be inserted.
+        :return: True if the entry was inserted, False if its key cannot be ordered against the keys of the tree.
+        """
+        if type(entry.key) is not self.key_type:
+            return False
+        try:
+            self.tree.insert(TreeBinKey(entry.hash_code, entry.key, entry, next(self.sequence)))
+        except TypeError:
+            return False  # The tree is left unchanged, as the comparison fails before linking the node
+        self.length += 1
+        return True
+
+    def find_with_probes(self, key, hash_code):
+        """
+        Finds an entry by key in the tree and counts the entries examined on the way
+        :return: the entry, or None if the key is not found, and the number of examined entries
+        """
+        tree_key, probes = self.search(key, hash_code)
+        return (None if tree_key is None else tree_key.entry), probes
+
+    def search(self, key, hash_code):
+        """
+        Finds the tree key of an entry, descending into both subtrees of the nodes whose key ties with it
+        :return: the tree key, or None if the key is not found, and the number of examined entries
+        """
+        if type(key) is not self.key_type:
+            # A key of another type may still be equal to a stored key (such as 1.0 and 1)
+            return self.scan(key, hash_code)
+        probes = 0
+        pending = [self.tree.get_root()]  # Subtrees left to search on the other side of ties
+        try:
+            while pending:
+                node = pending.pop()
+                while not node.is_sentinel:
+                    probes += 1
+                    tree_key = node.key
+                    if tree_key.hash_code != hash_code:
+                        node = node.left if hash_code < tree_key.hash_code else node.right
+                    elif tree_key.key == key:
+                        return tree_key, probes
+                    elif key < tree_key.key:
+                        node = node.left
+                    elif key > tree_key.key:
+                        node = node.right
+                    else:
+                        pending.append(node.right)
+                        node = node.left
+        except TypeError:
+            return self.scan(key, hash_code)
+        return None, probes
+
+    def scan(self, key, hash_code):
+        """
+        Finds the tree key of an entry by visiting all entries of the tree, for keys that cannot be ordered
+        against them
+        """
+        probes = 0
+        for tree_key in self.tree_keys():
+            probes += 1
+            if tree_key.hash_code == hash_code and tree_key.key == key:
+                return tree_key, probes
+        return None, probes
+
+    def find(self, key, hash_code=None):
+        """
+        Finds an entry by key in the tree
+        """
+        if hash_code is None:
+            hash_code = hash(key)
+        return self.find_with_probes(key, hash_code)[0]
+
+    def delete(self, key, hash_code=None):
+        """
+        Deletes an entry with the specified key from the tree
+        :return: True if the entry was found and successfully deleted, False otherwise.
+        """
+        if hash_code is None:
+            hash_code = hash(key)
+        tree_key = self.search(key, hash_code)[0]
+        if tree_key is None:
+            return False
+        self.tree.delete(tree_key)  # The stored tree key carries the sequence that places it in the tree
+        self.length -= 1
+        return True
+
+    def chain_length(self):
+        """
+        Returns the number of entries in the tree
+        """
+        return self.length
+
+    def print_bucket(self):
+        """
+        Prints all the entries in this hash table bucket in tree order.
+        """
+        print('(tree)', end='')
+        for entry in self:
+            print(f'->|{entry.key}, {entry.value}|', end='')
+        print()  # For newline
+
+
 class HashFunctonType(Enum):
     Division = 1
     Multiplication = 2
+    Fibonacci = 3  # Integer multiply-and-shift over power-of-two capacities
+
+
+# Golden-ratio constant for Fibonacci hashing: the odd integer closest to 2^64 / phi
+FIBONACCI_MULTIPLIER = 11400714819323198485
+WORD_BITS = 64
+WORD_MASK = (1 << WORD_BITS) - 1
+MULTIPLICATION_CONSTANT = (math.sqrt(5) - 1) / 2  # Constant for Multiplication Method
+# Number of old buckets moved by each operation during an incremental rehash, per half of the new capacity
+# the old array spans. Growing leaves room for at least 0.75 * old capacity inserts before the next resize,
+# and is done in old capacity / 2 operations. Shrinking leaves room for at least 0.375 * new capacity inserts,
+# and scaling the count by the ratio of the capacities makes it done in at most new capacity / 4 operations.
+# No shrink starts during a migration, so every migration completes before the next resize.
+MIGRATION_BUCKETS_PER_OPERATION = 2
+TREEIFY_THRESHOLD = 8  # Chain length above which a bucket is converted into a tree
+UNTREEIFY_THRESHOLD = 6  # Tree size at or below which a bucket is converted back into a chain
+MAX_LOAD_FACTOR = 0.75  # Load factor at which the bucket array is doubled
+MIN_LOAD_FACTOR = 0.1  # Load factor below which the bucket array is downsized
+SHRINK_LOAD_FACTOR = 0.375  # Load factor targeted when downsizing
+# Bits set per key by the Bloom filter. All of them are tested at once, within one word, and more bits
+# barely lower the false positive rate of a filter the table's load keeps at most three quarters full.
+BLOOM_FILTER_PROBES = 4
+
+
+# Ladder of bucket array capacities: the smallest prime above each power of 2^(1/4), up to 2^40.
+# Consecutive capacities grow by about 19%, so a doubled capacity is found with a binary search.
+PRIME_CAPACITIES = (
+    2, 3, 5, 7, 11, 13, 17, 23, 29, 37, 41, 47, 59, 67, 79, 97, 109, 131, 157, 191, 223, 257, 307, 367, 431,
+    521, 613, 727, 863, 1031, 1223, 1451, 1723, 2053, 2437, 2897, 3449, 4099, 4871, 5801, 6899, 8209, 9743,
+    11587, 13781, 16411, 19489, 23173, 27581, 32771, 38971, 46349, 55109, 65537, 77951, 92683, 110221,
+    131101, 155887, 185369, 220447, 262147, 311747, 370759, 440893, 524309, 623521, 741457, 881779, 1048583,
+    1246997, 1482919, 1763491, 2097169, 2493949, 2965847, 3526987, 4194319, 4987901, 5931649, 7053971,
+    8388617, 9975803, 11863289, 14107921, 16777259, 19951597, 23726569, 28215809, 33554467, 39903197,
+    47453149, 56431657, 67108879, 79806341, 94906297, 112863217, 134217757, 159612679, 189812533, 225726419,
+    268435459, 319225391, 379625083, 451452839, 536870923, 638450719, 759250133, 902905657, 1073741827,
+    1276901429, 1518500279, 1805811341, 2147483659, 2553802871, 3037000507, 3611622607, 4294967311,
+    5107605691, 6074001001, 7223245229, 8589934609, 10215211387, 12148002047, 14446490449, 17179869209,
+    20430422699, 24296004011, 28892980877, 34359738421, 40860845437, 48592008053, 57785961671, 68719476767,
+    81721690807, 97184016049, 115571923303, 137438953481, 163443381373, 194368032011, 231143846587,
+    274877906951, 326886762733, 388736063999, 462287693167, 549755813911, 653773525393, 777472128049,
+    924575386373, 1099511627791,
+)
+
+# Witnesses making the Miller-Rabin test deterministic for every number below 3.3 * 10^24
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
 
 
 def next_prime(start):
@@ -96,50 +416,313 @@ def next_prime(start):
         prime += 2
 
 
+def next_power_of_two(start):
+    """
+    Finds the smallest power of two greater than or equal to a given number
+    """
+    return 1 if start <= 1 else 1 << (start - 1).bit_length()
+
+
 def is_prime(num):
     """
-    Checks if a number is prime
+    Checks if a number is prime using the Miller-Rabin test
     """
     if num < 2:
         return False
-    for i in range(2, int(math.sqrt(num)) + 1):
-        if num % i == 0:
-            return False
+    for base in MILLER_RABIN_BASES:
+        if num % base == 0:
+            return num == base
+
+    # Write num - 1 as d * 2^r with d odd
+    d = num - 1
+    r = 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
+            return False  # The base witnesses that num is composite
     return True
 
 
+def adjust_capacity(capacity, hash_function_type):
+    """
+    Adjusts a requested capacity to one suited to the hash function:
+    a power of two for the Fibonacci method, a prime number otherwise.
+    """
+    if hash_function_type == HashFunctonType.Fibonacci:
+        return next_power_of_two(capacity)
+    if is_prime(capacity):
+        return capacity
+    # Take the next capacity from the prime ladder, or search for a prime beyond its end
+    if capacity <= PRIME_CAPACITIES[-1]:
+        return PRIME_CAPACITIES[bisect.bisect_left(PRIME_CAPACITIES, capacity)]
+    return next_prime(capacity)
+
+
+def division_index(hash_code, capacity):
+    """
+    Maps a hash code to an index using the Division Method
+    """
+    return abs(hash_code) % capacity
+
+
+def multiplication_index(hash_code, capacity):
+    """
+    Maps a hash code to an index using the Multiplication Method
+    """
+    # Use Decimal for high precision arithmetic
+    product = Decimal(abs(hash_code)) * Decimal(MULTIPLICATION_CONSTANT)
+    fractional_part = product - int(product)
+    return int(math.floor(capacity * fractional_part))
+
+
+def fibonacci_index(hash_code, capacity):
+    """
+    Maps a hash code to an index using Fibonacci hashing
+    """
+    # Multiply by 2^64 / phi and keep the top log2(capacity) bits of the 64-bit product.
+    # The capacity is a power of two, so no floating point or Decimal arithmetic is needed.
+    # Masking the product alone is enough, as the low 64 bits of a product only depend on those of its factors.
+    return (hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> (WORD_BITS + 1 - capacity.bit_length())
+
+
+def get_index_function(hash_function_type):
+    """
+    Returns the function mapping a hash code and a capacity to an index for the given hash function type.
+    Resolving it once lets loops over many keys skip the per-key dispatch.
+    """
+    if hash_function_type == HashFunctonType.Division:
+        return division_index
+    elif hash_function_type == HashFunctonType.Multiplication:
+        return multiplication_index
+    elif hash_function_type == HashFunctonType.Fibonacci:
+        return fibonacci_index
+    else:
+        raise Exception("Unknown Hash Function Type")
+
+
+def compute_index(hash_code, capacity, hash_function_type):
+    """
+    Maps a hash code to an index in an array of the given capacity
+    using the specified hash function.
+    """
+    return get_index_function(hash_function_type)(hash_code, capacity)
+
+
+# Snapshot file layout: a header, the bucket indices and the hash codes of the entries as arrays
+# of 64-bit integers, then a column of keys and a column of values in the same entry order
+SNAPSHOT_MAGIC = b'HTSNAP01'
+# Header: magic, hash function type, capacity, minimum capacity, size, flags, hash fingerprint
+SNAPSHOT_HEADER = struct.Struct('<8sIQQQBq')
+# Column header: type tag and length in bytes of the column data
+SNAPSHOT_COLUMN = struct.Struct('<cQ')
+INCREMENTAL_REHASH_FLAG = 1
+SHRINK_ON_DELETE_FLAG = 2
+# The hash of str and bytes keys differs between processes unless PYTHONHASHSEED is set.
+# A snapshot stores the hash of this string, so that a process loading it can tell whether
+# the stored hash codes and bucket indices are still valid for it.
+HASH_FINGERPRINT_KEY = 'hash table snapshot'
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def pack_array(typecode, values):
+    """
+    Converts numbers into the little-endian bytes of an array with the given type code
+    """
+    numbers = array(typecode, values)
+    if sys.byteorder == 'big':
+        numbers.byteswap()
+    return numbers.tobytes()
+
+
+def unpack_array(typecode, data):
+    """
+    Restores an array with the given type code from little-endian bytes
+    """
+    numbers = array(typecode)
+    numbers.frombytes(data)
+    if sys.byteorder == 'big':
+        numbers.byteswap()
+    return numbers
+
+
+def encode_snapshot_column(column):
+    """
+    Encodes the keys or the values of a snapshot as a type tag and a length-prefixed block of bytes.
+    A column of str holds their lengths followed by their concatenated UTF-8 text, where lone surrogates
+    (such as those of os.fsdecode for undecodable file names) are kept with 'surrogatepass', and columns
+    of 64-bit ints or of floats are arrays, so that each decodes with a few bulk conversions.
+    Any other column is pickled.
+    """
+    column_types = set(map(type, column))
+    if column_types == {str}:
+        lengths = pack_array('Q', map(len, column))
+        tag, data = b'S', lengths + ''.join(column).encode('utf-8', 'surrogatepass')
+    elif column_types == {int} and INT64_MIN <= min(column) and max(column) <= INT64_MAX:
+        tag, data = b'I', pack_array('q', column)
+    elif column_types == {float}:
+        tag, data = b'D', pack_array('d', column)
+    else:
+        tag, data = b'P', pickle.dumps(column, pickle.HIGHEST_PROTOCOL)
+    return SNAPSHOT_COLUMN.pack(tag, len(data)) + data
+
+
+def decode_snapshot_column(data, offset, size):
+    """
+    Decodes a column written by encode_snapshot_column.
+    :return: the list of keys or values and the offset following the column
+    """
+    tag, length = SNAPSHOT_COLUMN.unpack_from(data, offset)
+    start = offset + SNAPSHOT_COLUMN.size
+    end = start + length
+    if tag == b'S':
+        text_start = start + 8 * size
+        text = str(data[text_start:end], 'utf-8', 'surrogatepass')
+        ends = list(itertools.accumulate(unpack_array('Q', data[start:text_start])))
+        return list(map(text.__getitem__, map(slice, [0] + ends, ends))), end
+    if tag == b'I':
+        return unpack_array('q', data[start:end]).tolist(), end
+    if tag == b'D':
+        return unpack_array('d', data[start:end]).tolist(), end
+    if tag == b'P':
+        return pickle.loads(data[start:end]), end
+    raise ValueError(f"Unknown column type in snapshot: {tag!r}")
+
+
+class HashTableStats:
+    """
+    Collects operation counters of a hash table while statistics are enabled
+    """
+
+    def __init__(self):
+        self.get_count = 0  # Number of get calls
+        self.total_probes = 0  # Number of entries examined by all get calls
+        self.max_probes = 0  # Largest number of entries examined by a single get call
+        self.rehash_count = 0  # Number of resizes of the bucket array
+        self.rehash_time_ns = 0  # Time spent allocating bucket arrays and migrating entries
+        self.bloom_rejections = 0  # Number of get calls answered by the Bloom filter alone
+        self.bloom_false_positives = 0  # Number of get calls for absent keys that passed the Bloom filter
+
+    def record_get(self, probes):
+        self.get_count += 1
+        self.total_probes += probes
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+
 class HashTable:
     """
     A hash table implementation using chaining with linked lists to resolve collisions.
+    Buckets whose chains grow too long are converted into red-black trees.
     This class provides methods for inserting, retrieving, and removing key-value pairs,
     where keys are strings and values are numbers.
     """
 
-    def __init__(self, capacity, hash_function_type):
+    def __init__(self, capacity, hash_function_type, incremental_rehash=False, shrink_on_delete=True):
         if capacity < 1:
             raise ValueError("Initial capacity must be >= 1")
-        # Adjust capacity to the next prime number if it's not already prime
-        capacity = capacity if is_prime(capacity) else next_prime(capacity)
+        self.hash_function_type = hash_function_type
+        # Resolved once, so that single-key operations skip the dispatch on the hash function type
+        self.index_function = get_index_function(hash_function_type)
+        capacity = adjust_capacity(capacity, hash_function_type)
         self.bucket_array: List[Optional[HashTableBucket]] = [None] * capacity
+        # With shrinking on delete, a sparse bucket array is downsized, but never below the initial capacity
+        self.shrink_on_delete = shrink_on_delete
+        self.min_capacity = capacity
         self.size = 0  # Number of key-value pairs in the hash table
-        self.hash_function_type = hash_function_type
-        self.A = (math.sqrt(5) - 1) / 2  # Constant for Multiplication Method
+        self.A = MULTIPLICATION_CONSTANT
+        # With incremental rehashing, entries are moved to a resized array a few buckets per operation
+        self.incremental_rehash = incremental_rehash
+        self.old_bucket_array: Optional[List[Optional[HashTableBucket]]] = None  # Array being migrated
+        self.migration_index = 0  # Index of the next old bucket to migrate
+        self.migration_step = MIGRATION_BUCKETS_PER_OPERATION  # Old buckets migrated by each operation
+        self.stats: Optional[HashTableStats] = None  # Counters, only collected when enabled
+        self.bloom_filter: Optional[BloomFilter] = None  # Filter of the stored hash codes, only kept when enabled
+        self.bloom_stale_count = 0  # Removed entries whose bits are still set in the Bloom filter
+        # Filter sized for the resized array, filled as buckets migrate, and its count of removed entries
+        self.migration_bloom_filter: Optional[BloomFilter] = None
+        self.migration_bloom_stale_count = 0
+        # Number of insertions, removals and relinkings, which lets iterators detect concurrent modifications
+        self.modification_count = 0
 
     def hash(self, key):
         """
         Computes the hash value for a given key
         """
-        hash_code = hash(key)
+        return self.index_function(hash(key), len(self.bucket_array))
+
+    def bucket_index(self, hash_code, bucket_array):
+        """
+        Returns the index of the bucket of the given array where a hash code belongs
+        """
+        return self.index_function(hash_code, len(bucket_array))
+
+    def find_bucket(self, hash_code, bucket_array):
+        """
+        Returns the bucket of the given array where a hash code belongs, or None if that bucket is empty
+        """
+        return bucket_array[self.index_function(hash_code, len(bucket_array))]
+
+    def find_entry(self, key, hash_code):
+        """
+        Finds the entry holding a key, also looking into the old bucket array during a migration.
+        :return: the entry, or None if the key is not found
+        """
+        bucket_array = self.bucket_array
+        bucket = bucket_array[self.index_function(hash_code, len(bucket_array))]
+        entry = bucket.find(key, hash_code) if bucket is not None else None
+        if entry is None and self.old_bucket_array is not None:
+            bucket = self.find_bucket(hash_code, self.old_bucket_array)
+            entry = bucket.find(key, hash_code) if bucket is not None else None
+        return entry
 
-        if self.hash_function_type == HashFunctonType.Division:
-            return abs(hash_code) % len(self.bucket_array)
-        elif self.hash_function_type == HashFunctonType.Multiplication:
-            # Use Decimal for high precision arithmetic
-            product = Decimal(abs(hash_code)) * Decimal(self.A)
-            fractional_part = product - int(product)
-            return int(math.floor(len(self.bucket_array) * fractional_part))
+    def link_entry(self, entry):
+        """
+        Links an entry into the bucket of the current array selected by its cached hash code
+        """
+        bucket_array = self.bucket_array
+        self.add_entry(bucket_array, self.index_function(entry.hash_code, len(bucket_array)), entry)
+
+    @staticmethod
+    def add_entry(bucket_array, index, entry):
+        """
+        Adds an entry to a bucket, converting the bucket into a tree when its chain grows too long
+        and back into a chain when the tree cannot order the new key.
+        """
+        bucket = bucket_array[index]
+        if bucket is None:
+            bucket = bucket_array[index] = HashTableBucket()  # Lazy initialization
+        if isinstance(bucket, HashTableTreeBucket):
+            if not bucket.try_insert_entry(entry):
+                bucket = bucket_array[index] = bucket.to_chain()
+                bucket.insert_entry(entry)
         else:
-            raise Exception("Unknown Hash Function Type")
+            bucket.insert_entry(entry)
+            if bucket.length > TREEIFY_THRESHOLD:
+                bucket_array[index] = HashTableTreeBucket.from_chain(bucket) or bucket
+
+    @staticmethod
+    def delete_entry(bucket_array, index, key, hash_code):
+        """
+        Deletes the entry of a key from a bucket, converting a tree that became small back into a chain.
+        :return: True if the entry was found and successfully deleted, False otherwise.
+        """
+        bucket = bucket_array[index]
+        if bucket is None or not bucket.delete(key, hash_code):
+            return False
+        if isinstance(bucket, HashTableTreeBucket) and bucket.length <= UNTREEIFY_THRESHOLD:
+            bucket_array[index] = bucket.to_chain()
+        return True
 
     def put(self, key, value):
         """
@@ -147,27 +730,30 @@ class HashTable:
         :param key: the key to insert or update
         :param value: the value associated with the key
         """
-        index = self.hash(key)  # Compute the index for this key using the hash function
-        if self.bucket_array[index] is None:
-            self.bucket_array[index] = HashTableBucket()  # Lazy initialization
+        if self.old_bucket_array is not None:
+            self.migrate_buckets(self.migration_step)
 
-        bucket = self.bucket_array[index]
-        existing_entry = bucket.find(key)
+        hash_code = hash(key)
+        bloom_filter = self.bloom_filter
+        # A key rejected by the Bloom filter is known to be absent, so no bucket needs to be searched
+        if bloom_filter is None or bloom_filter.might_contain(hash_code):
+            existing_entry = self.find_entry(key, hash_code)
+            if existing_entry is not None:
+                # Key found, update value
+                existing_entry.value = value
+                return
 
-        if existing_entry is not None:
-            # Key found, update value
-            existing_entry.value = value
-        else:
-            # Check if adding a new entry would exceed the load factor and trigger rehashing if necessary
-            if (self.size + 1) / len(self.bucket_array) >= 0.75:
-                self.rehash()
-                index = self.hash(key)  # Recompute index as length of the array has changed
-                if self.bucket_array[index] is None:
-                    self.bucket_array[index] = HashTableBucket()
-                bucket = self.bucket_array[index]
+        # Check if adding a new entry would exceed the load factor and trigger rehashing if necessary
+        if (self.size + 1) / len(self.bucket_array) >= MAX_LOAD_FACTOR:
+            self.rehash()
 
-            bucket.insert_at_beginning(key, value)
-            self.size += 1
+        self.link_entry(HashTableEntry(key, value, hash_code))
+        if self.bloom_filter is not None:
+            self.bloom_filter.add(hash_code)
+            if self.migration_bloom_filter is not None:
+                self.migration_bloom_filter.add(hash_code)
+        self.size += 1
+        self.modification_count += 1
 
     def get(self, key):
         """
@@ -175,11 +761,34 @@ class HashTable:
         :param key: the key whose value is to be retrieved
         :return: the value associated with the key, or None if the key is not found
         """
-        index = self.hash(key)
-        bucket = self.bucket_array[index]
-        if bucket is None:
+        if self.old_bucket_array is not None:
+            self.migrate_buckets(self.migration_step)
+        hash_code = hash(key)
+        if self.bloom_filter is not None and not self.bloom_filter.might_contain(hash_code):
+            if self.stats is not None:
+                self.stats.bloom_rejections += 1
+                self.stats.record_get(0)
             return None
-        entry = bucket.find(key)
+        if self.stats is not None:
+            return self.get_with_stats(key, hash_code)
+
+        entry = self.find_entry(key, hash_code)
+        return entry.value if entry is not None else None
+
+    def get_with_stats(self, key, hash_code):
+        """
+        Retrieves the value associated with a given key, recording how many entries were examined
+        """
+        bucket = self.find_bucket(hash_code, self.bucket_array)
+        entry, probes = bucket.find_with_probes(key, hash_code) if bucket is not None else (None, 0)
+        if entry is None and self.old_bucket_array is not None:
+            bucket = self.find_bucket(hash_code, self.old_bucket_array)
+            if bucket is not None:
+                entry, old_probes = bucket.find_with_probes(key, hash_code)
+                probes += old_probes
+        self.stats.record_get(probes)
+        if entry is None and self.bloom_filter is not None:
+            self.stats.bloom_false_positives += 1
         return entry.value if entry is not None else None
 
     def remove(self, key):
@@ -188,38 +797,527 @@ class HashTable:
         :param key: the key of the pair to be removed
         :return: True if the pair was successfully removed, False if the key was not found
         """
-        index = self.hash(key)
-        bucket = self.bucket_array[index]
-        if bucket is None:
-            return False
-        was_deleted = bucket.delete(key)
+        if self.old_bucket_array is not None:
+            self.migrate_buckets(self.migration_step)
+
+        hash_code = hash(key)
+        was_deleted = self.delete_entry(self.bucket_array, self.bucket_index(hash_code, self.bucket_array),
+                                        key, hash_code)
+        if not was_deleted and self.old_bucket_array is not None:
+            was_deleted = self.delete_entry(self.old_bucket_array,
+                                            self.bucket_index(hash_code, self.old_bucket_array), key, hash_code)
 
         if was_deleted:
             self.size -= 1
+            self.modification_count += 1
+            if self.bloom_filter is not None:
+                self.count_stale_bloom_entries(1)
+            self.shrink_if_sparse()
         return was_deleted
 
-    def rehash(self):
+    def rehash(self, new_capacity=None):
         """
-        Doubles the size of the hash table and rehashes all existing entries
+        Doubles the size of the hash table, or resizes it to the given capacity, and relinks
+        all existing entries using their cached hash codes. With incremental rehashing, only
+        the new array is allocated here and the entries are migrated by subsequent operations.
         """
-        old_bucket_array = self.bucket_array
-        # Find the next prime number greater than double the current length
-        new_capacity = next_prime(len(self.bucket_array) * 2)
+        self.finish_migration()  # Complete the previous migration before starting a new one
+
+        start_ns = time.perf_counter_ns() if self.stats is not None else 0
+        if new_capacity is None:
+            new_capacity = len(self.bucket_array) * 2
+        # Find the next suitable capacity (a prime, or a power of two for the Fibonacci method)
+        # greater than or equal to the requested one
+        new_capacity = adjust_capacity(new_capacity, self.hash_function_type)
+        self.old_bucket_array = self.bucket_array
+        self.migration_index = 0
+        self.migration_step = MIGRATION_BUCKETS_PER_OPERATION * -(-2 * len(self.old_bucket_array) // new_capacity)
+        self.modification_count += 1
         self.bucket_array: List[Optional[HashTableBucket]] = [None] * new_capacity
-        self.size = 0
+        if self.bloom_filter is not None:
+            # The current filter keeps answering until the migration completes, while the filter of the
+            # new array is filled bucket by bucket, so that no single operation walks every entry
+            self.migration_bloom_filter = self.create_bloom_filter()
+            self.migration_bloom_stale_count = 0
+        if self.stats is not None:
+            self.stats.rehash_count += 1
+            self.stats.rehash_time_ns += time.perf_counter_ns() - start_ns
+
+        if not self.incremental_rehash:
+            self.finish_migration()
+
+    def finish_migration(self):
+        """
+        Migrates all remaining old buckets if an incremental rehash is in progress
+        """
+        if self.old_bucket_array is not None:
+            self.migrate_buckets(len(self.old_bucket_array))
+
+    def reserve(self, count):
+        """
+        Grows the bucket array at once so that `count` more entries fit without any rehashing.
+        """
+        required_capacity = int((self.size + count) / MAX_LOAD_FACTOR) + 1
+        if required_capacity > len(self.bucket_array):
+            self.rehash(required_capacity)
+            self.finish_migration()
+
+    def shrink_if_sparse(self):
+        """
+        Downsizes the bucket array when its load factor drops below MIN_LOAD_FACTOR.
+        The array is resized to SHRINK_LOAD_FACTOR, well between both thresholds, so that
+        alternating inserts and removals do not make it grow and shrink over and over.
+        No shrink starts while a migration is in progress, as it would have to complete it at once.
+        """
+        capacity = len(self.bucket_array)
+        if not self.shrink_on_delete or self.old_bucket_array is not None:
+            return
+        if capacity <= self.min_capacity or self.size / capacity >= MIN_LOAD_FACTOR:
+            return
+        new_capacity = max(self.min_capacity, int(self.size / SHRINK_LOAD_FACTOR) + 1)
+        if adjust_capacity(new_capacity, self.hash_function_type) < capacity:
+            self.rehash(new_capacity)
+
+    def compact(self):
+        """
+        Shrinks the bucket array to the smallest capacity holding the current entries
+        below the maximum load factor, releasing the memory of empty buckets.
+        """
+        self.finish_migration()
+        new_capacity = int(self.size / MAX_LOAD_FACTOR) + 1
+        if adjust_capacity(new_capacity, self.hash_function_type) < len(self.bucket_array):
+            self.rehash(new_capacity)
+            self.finish_migration()
+
+    def migrate_buckets(self, count):
+        """
+        Moves the entries of up to `count` buckets from the old bucket array into the current one.
+        Entries are relinked rather than copied, and the old array is released once all of its
+        buckets have been migrated.
+        """
+        start_ns = time.perf_counter_ns() if self.stats is not None else 0
+        old_bucket_array = self.old_bucket_array
+        migration_bloom_filter = self.migration_bloom_filter
+        end = min(self.migration_index + count, len(old_bucket_array))
+        for i in range(self.migration_index, end):
+            bucket = old_bucket_array[i]
+            if bucket is not None:
+                for entry in bucket:
+                    self.link_entry(entry)
+                    if migration_bloom_filter is not None:
+                        migration_bloom_filter.add(entry.hash_code)
+                old_bucket_array[i] = None
+        self.migration_index = end
+        self.modification_count += 1
+        if end == len(old_bucket_array):
+            self.old_bucket_array = None
+            if migration_bloom_filter is not None:
+                self.bloom_filter = migration_bloom_filter
+                self.bloom_stale_count = self.migration_bloom_stale_count
+                self.migration_bloom_filter = None
+                self.count_stale_bloom_entries(0)  # Rebuilds it if removals outnumber the entries
+        if self.stats is not None:
+            self.stats.rehash_time_ns += time.perf_counter_ns() - start_ns
+
+    def enable_stats(self):
+        """
+        Starts collecting operation counters. Until this is called, the only cost
+        of the instrumentation is one attribute check in get and during rehashing.
+        """
+        if self.stats is None:
+            self.stats = HashTableStats()
+
+    def disable_stats(self):
+        """
+        Stops collecting operation counters and discards the collected ones
+        """
+        self.stats = None
+
+    def enable_bloom_filter(self):
+        """
+        Starts maintaining a Bloom filter of the stored hash codes, consulted by get and put before
+        any bucket is touched. Lookups of absent keys are then mostly answered by the filter alone,
+        at the price of a word test for lookups of present keys and for insertions. As the chains of
+        the table are short, the filter only pays off when most lookups are for absent keys, or when
+        keys are slow to compare. Otherwise it slows lookups down.
+        """
+        if self.bloom_filter is None:
+            self.rebuild_bloom_filter()
 
-        for bucket in old_bucket_array:
+    def disable_bloom_filter(self):
+        """
+        Stops maintaining the Bloom filter and releases it
+        """
+        self.bloom_filter = None
+        self.migration_bloom_filter = None
+
+    def rebuild_bloom_filter(self):
+        """
+        Replaces the Bloom filter with one sized for the current capacity, holding the hash codes of
+        all entries. Rebuilding also clears the stale bits left by removed entries.
+        """
+        bloom_filter = self.create_bloom_filter()
+        for bucket_array in (self.bucket_array, self.old_bucket_array):
+            if bucket_array is not None:
+                for bucket in bucket_array:
+                    if bucket is not None:
+                        for entry in bucket:
+                            bloom_filter.add(entry.hash_code)
+        self.bloom_filter = bloom_filter
+        self.bloom_stale_count = 0
+        self.migration_bloom_filter = None  # The rebuilt filter already covers both arrays
+
+    def create_bloom_filter(self):
+        """
+        Creates an empty Bloom filter sized for the current capacity
+        """
+        return BloomFilter(int(len(self.bucket_array) * MAX_LOAD_FACTOR) + 1, probe_count=BLOOM_FILTER_PROBES)
+
+    def count_stale_bloom_entries(self, count):
+        """
+        Records removed entries, whose bits can not be cleared from the Bloom filter. Once they
+        outnumber the remaining entries, the filter is rebuilt, so that its false positive rate
+        stays bounded under churn at an amortized constant cost per removal. During a migration,
+        the removals are also counted for the filter of the new array, and the check waits until
+        the migration completes, since a rebuild would walk both arrays at once.
+        """
+        self.bloom_stale_count += count
+        if self.migration_bloom_filter is not None:
+            self.migration_bloom_stale_count += count
+        elif self.bloom_stale_count > self.size:
+            self.rebuild_bloom_filter()
+
+    def get_stats(self):
+        """
+        Reports the distribution of the entries over the buckets, together with the
+        operation counters collected since the statistics were enabled.
+        :return: a dictionary of statistics
+        """
+        chain_length_histogram = {}
+        bucket_arrays = [self.bucket_array]
+        if self.old_bucket_array is not None:
+            bucket_arrays.append(self.old_bucket_array[self.migration_index:])
+        for bucket_array in bucket_arrays:
+            for bucket in bucket_array:
+                chain_length = bucket.chain_length() if bucket is not None else 0
+                chain_length_histogram[chain_length] = chain_length_histogram.get(chain_length, 0) + 1
+
+        capacity = len(self.bucket_array)
+        empty_bucket_count = chain_length_histogram.get(0, 0)
+        bucket_count = sum(chain_length_histogram.values())
+        report = {
+            'size': self.size,
+            'capacity': capacity,
+            'load_factor': self.size / capacity,
+            'bucket_occupancy': (bucket_count - empty_bucket_count) / bucket_count,
+            'chain_length_histogram': dict(sorted(chain_length_histogram.items())),
+            'max_chain_length': max(chain_length_histogram),
+        }
+        if self.bloom_filter is not None:
+            report.update({
+                'bloom_filter_bits': self.bloom_filter.bit_count,
+                'bloom_filter_fill_ratio': self.bloom_filter.fill_ratio(),
+                'bloom_filter_false_positive_rate': self.bloom_filter.false_positive_rate(),
+            })
+        if self.stats is not None:
+            stats = self.stats
+            report.update({
+                'get_count': stats.get_count,
+                'average_probes': stats.total_probes / stats.get_count if stats.get_count else 0.0,
+                'max_probes': stats.max_probes,
+                'rehash_count': stats.rehash_count,
+                'rehash_time_ms': stats.rehash_time_ns / 1_000_000,
+            })
+            if self.bloom_filter is not None:
+                absent_count = stats.bloom_rejections + stats.bloom_false_positives
+                report.update({
+                    'bloom_rejections': stats.bloom_rejections,
+                    'bloom_false_positives': stats.bloom_false_positives,
+                    'measured_false_positive_rate': stats.bloom_false_positives / absent_count if absent_count else 0.0,
+                })
+        return report
+
+    @classmethod
+    def from_items(cls, items, hash_function_type, length_hint=None, incremental_rehash=False,
+                   shrink_on_delete=True):
+        """
+        Creates a hash table holding the given key-value pairs. The bucket array is sized up front
+        from the number of items, so no rehashing happens while loading them.
+        :param items: an iterable of (key, value) pairs
+        :param hash_function_type: the hash function of the new table
+        :param length_hint: the expected number of items, taken from the iterable if omitted
+        :param incremental_rehash: whether later resizes of the table are incremental
+        :param shrink_on_delete: whether the table shrinks when entries are removed
+        """
+        if length_hint is None:
+            length_hint = operator.length_hint(items)
+        capacity = int(length_hint / MAX_LOAD_FACTOR) + 1
+        hash_table = cls(capacity, hash_function_type, incremental_rehash, shrink_on_delete)
+        hash_table.put_many(items, length_hint)
+        return hash_table
+
+    def put_many(self, items, length_hint=None):
+        """
+        Inserts or updates many key-value pairs. The bucket array is grown once from the
+        expected number of items instead of being doubled repeatedly while they are inserted.
+        :param items: an iterable of (key, value) pairs
+        :param length_hint: the expected number of items, taken from the iterable if omitted
+        """
+        self.finish_migration()
+        self.reserve(operator.length_hint(items) if length_hint is None else length_hint)
+
+        # Hoist attribute lookups out of the loop
+        index_of = self.index_function
+        add_entry = self.add_entry
+        bucket_array = self.bucket_array
+        capacity = len(bucket_array)
+        bloom_filter = self.bloom_filter
+        size = self.size
+        try:
+            for key, value in items:
+                hash_code = hash(key)
+                bucket = bucket_array[index_of(hash_code, capacity)]
+                if bucket is not None and (bloom_filter is None or bloom_filter.might_contain(hash_code)):
+                    existing_entry = bucket.find(key, hash_code)
+                    if existing_entry is not None:
+                        existing_entry.value = value
+                        continue
+
+                if (size + 1) / capacity >= MAX_LOAD_FACTOR:
+                    # The length hint was too small
+                    self.modification_count += size - self.size
+                    self.size = size
+                    self.rehash()
+                    self.finish_migration()
+                    bucket_array = self.bucket_array
+                    capacity = len(bucket_array)
+                    bloom_filter = self.bloom_filter
+
+                add_entry(bucket_array, index_of(hash_code, capacity), HashTableEntry(key, value, hash_code))
+                if bloom_filter is not None:
+                    bloom_filter.add(hash_code)
+                size += 1
+        finally:
+            # Counts the entries inserted before an item failed, such as one with an unhashable key
+            self.modification_count += size - self.size
+            self.size = size
+
+    def get_many(self, keys):
+        """
+        Retrieves the values associated with many keys.
+        :param keys: an iterable of keys
+        :return: a list with the value of each key, or None for keys that are not found
+        """
+        self.finish_migration()
+        index_of = self.index_function
+        bucket_array = self.bucket_array
+        capacity = len(bucket_array)
+        might_contain = self.bloom_filter.might_contain if self.bloom_filter is not None else None
+        values = []
+        for key in keys:
+            hash_code = hash(key)
+            if might_contain is not None and not might_contain(hash_code):
+                values.append(None)
+                continue
+            bucket = bucket_array[index_of(hash_code, capacity)]
+            entry = bucket.find(key, hash_code) if bucket is not None else None
+            values.append(entry.value if entry is not None else None)
+        return values
+
+    def remove_many(self, keys):
+        """
+        Removes the key-value pairs of many keys.
+        :param keys: an iterable of keys
+        :return: the number of pairs that were removed
+        """
+        self.finish_migration()
+        index_of = self.index_function
+        delete_entry = self.delete_entry
+        bucket_array = self.bucket_array
+        capacity = len(bucket_array)
+        removed_count = 0
+        try:
+            for key in keys:
+                hash_code = hash(key)
+                if delete_entry(bucket_array, index_of(hash_code, capacity), key, hash_code):
+                    removed_count += 1
+        finally:
+            # Counts the entries removed before a key failed, such as an unhashable one
+            self.size -= removed_count
+            self.modification_count += removed_count
+            if self.bloom_filter is not None:
+                self.count_stale_bloom_entries(removed_count)
+        self.shrink_if_sparse()
+        return removed_count
+
+    def to_bytes(self):
+        """
+        Encodes the table as a snapshot, keeping the bucket index and hash code of every entry.
+        """
+        self.finish_migration()
+        indices, hash_codes, keys, values = [], [], [], []
+        for index, bucket in enumerate(self.bucket_array):
+            if bucket is not None:
+                for entry in bucket:
+                    indices.append(index)
+                    hash_codes.append(entry.hash_code)
+                    keys.append(entry.key)
+                    values.append(entry.value)
+        flags = ((INCREMENTAL_REHASH_FLAG if self.incremental_rehash else 0)
+                 | (SHRINK_ON_DELETE_FLAG if self.shrink_on_delete else 0))
+        return b''.join((
+            SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.hash_function_type.value, len(self.bucket_array),
+                                 self.min_capacity, self.size, flags, hash(HASH_FINGERPRINT_KEY)),
+            pack_array('Q', indices),
+            pack_array('q', hash_codes),
+            encode_snapshot_column(keys),
+            encode_snapshot_column(values),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Restores a table from a snapshot created by to_bytes. The bucket array is allocated
+        with the stored capacity and entries are linked at their stored bucket indices, so
+        neither a capacity search nor hashing takes place, unless the snapshot was written by
+        a process whose str and bytes hashes differ from the current one.
+
+        Columns of keys or values other than str, int and float are unpickled, so restoring a snapshot
+        from an untrusted source can run arbitrary code.
+        """
+        data = memoryview(data)
+        magic, hash_function_value, capacity, min_capacity, size, flags, fingerprint = \
+            SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a hash table snapshot")
+        hash_table = cls(1, HashFunctonType(hash_function_value),
+                         bool(flags & INCREMENTAL_REHASH_FLAG), bool(flags & SHRINK_ON_DELETE_FLAG))
+        # The stored capacity was already adjusted when the table was built, so it is used as is
+        bucket_array: List[Optional[HashTableBucket]] = [None] * capacity
+        hash_table.bucket_array = bucket_array
+        hash_table.min_capacity = min_capacity
+        hash_table.size = size
+
+        # Allocating millions of keys, values and entries would otherwise trigger repeated full garbage
+        # collections, which cost more than the restore itself while finding no cycles among the new objects
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            offset = SNAPSHOT_HEADER.size
+            indices = unpack_array('Q', data[offset:offset + 8 * size])
+            offset += 8 * size
+            hash_codes = unpack_array('q', data[offset:offset + 8 * size])
+            offset += 8 * size
+            keys, offset = decode_snapshot_column(data, offset, size)
+            values, offset = decode_snapshot_column(data, offset, size)
+            if fingerprint != hash(HASH_FINGERPRINT_KEY):
+                index_of = hash_table.index_function
+                hash_codes = list(map(hash, keys))
+                indices = [index_of(hash_code, capacity) for hash_code in hash_codes]
+
+            add_entry = hash_table.add_entry
+            for index, hash_code, key, value in zip(indices, hash_codes, keys, values):
+                add_entry(bucket_array, index, HashTableEntry(key, value, hash_code))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return hash_table
+
+    def save(self, path):
+        """
+        Writes a snapshot of the table to a file
+        :param path: the path of the snapshot file
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+        Restores a table from a snapshot file written by save. Like from_bytes, it unpickles columns
+        of other types than str, int and float, so it must only read trusted files.
+        :param path: the path of the snapshot file
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+    def entries(self):
+        """
+        Iterates over the entries of the table, bucket by bucket, without copying them.
+        Any migration in progress is completed first. Inserting or removing keys, or resizing
+        the table, while the iteration is in progress makes it raise a RuntimeError.
+        """
+        self.finish_migration()
+        expected_modification_count = self.modification_count
+        for bucket in self.bucket_array:
             if bucket is not None:
-                current = bucket.head
-                while current is not None:
-                    # Re-add each entry to the new table
-                    self.put(current.key, current.value)
-                    current = current.next
+                for entry in bucket:
+                    yield entry
+                    if self.modification_count != expected_modification_count:
+                        raise RuntimeError("HashTable changed during iteration")
+
+    def keys(self):
+        """
+        Iterates over the keys of the table
+        """
+        return (entry.key for entry in self.entries())
+
+    def values(self):
+        """
+        Iterates over the values of the table
+        """
+        return (entry.value for entry in self.entries())
+
+    def items(self):
+        """
+        Iterates over the key-value pairs of the table
+        """
+        return ((entry.key, entry.value) for entry in self.entries())
+
+    def __iter__(self):
+        return self.keys()
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        hash_code = hash(key)
+        if self.bloom_filter is not None and not self.bloom_filter.might_contain(hash_code):
+            return False
+        return self.find_entry(key, hash_code) is not None
+
+    def __getitem__(self, key):
+        """
+        Retrieves the value associated with a given key, which may be None.
+        :raises KeyError: if the key is not found
+        """
+        entry = self.find_entry(key, hash(key))
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        """
+        Removes the key-value pair of a given key.
+        :raises KeyError: if the key is not found
+        """
+        if not self.remove(key):
+            raise KeyError(key)
 
     def print_hash_table(self):
         """
         Prints the entire contents of the hash table
         """
+        if self.old_bucket_array is not None:
+            print(f'Migrating: {self.migration_index} of {len(self.old_bucket_array)} old buckets moved')
+            for i in range(self.migration_index, len(self.old_bucket_array)):
+                bucket = self.old_bucket_array[i]
+                if bucket is not None:
+                    print(f'[old {i}]', end='')
+                    bucket.print_bucket()
         for i, bucket in enumerate(self.bucket_array):
             print(f'[{i}]', end='')
             if bucket is not None:
@@ -0,0 +1,376 @@
+import gc
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from hashtable.hash_table import HashFunctonType
+from hashtable.hash_table import HashTable
+from hashtable.concurrent_hash_table import ConcurrentHashTable
+from hashtable.cuckoo_hash_table import CuckooHashTable
+from hashtable.int_hash_table import IntHashTable
+from hashtable.open_addressing_hash_table import OpenAddressingHashTable
+from hashtable.sharded_hash_table import ShardedHashTable
+
+
+def time_per_operation(operation, keys):
+    """
+    Runs an operation for every key and measures the average time it takes.
+
+    :param operation: a callable accepting a single key
+    :param keys: the keys to pass to the operation
+    :return: the average duration of one operation, in nanoseconds
+    """
+    start = time.perf_counter_ns()
+    for key in keys:
+        operation(key)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def benchmark_hash_functions(key_count=100_000):
+    """
+    Compares put and get timings of the available hash functions.
+    The table starts with a small capacity, so the put timings include rehashing.
+    """
+    keys = [f"key-{i}" for i in range(key_count)]
+    print(f"{'Hash function':<16}{'put ns/op':>12}{'get ns/op':>12}")
+    for hash_function_type in HashFunctonType:
+        hash_table = HashTable(16, hash_function_type)
+        put_ns = time_per_operation(lambda key: hash_table.put(key, key), keys)
+        get_ns = time_per_operation(hash_table.get, keys)
+        print(f"{hash_function_type.name:<16}{put_ns:>12.0f}{get_ns:>12.0f}")
+
+
+def measure_build(create_table, keys):
+    """
+    Builds a table holding the given keys and measures the memory it occupies.
+
+    :param create_table: a callable returning an empty table
+    :param keys: the keys to insert
+    :return: the built table and the number of bytes allocated while building it
+    """
+    tracemalloc.start()
+    table = create_table()
+    for key in keys:
+        table.put(key, key)
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return table, allocated_bytes
+
+
+def benchmark_open_addressing(key_count=100_000):
+    """
+    Compares memory per entry and lookup throughput of the chaining and the open addressing tables.
+    The keys are shared by both tables, so their own memory is not counted.
+    """
+    keys = [f"key-{i}" for i in range(key_count)]
+    missing_keys = [f"missing-{i}" for i in range(key_count)]
+    tables = {
+        "Chaining": lambda: HashTable(16, HashFunctonType.Fibonacci),
+        "Open addressing": lambda: OpenAddressingHashTable(16, HashFunctonType.Fibonacci),
+    }
+    print(f"{'Table':<18}{'bytes/entry':>13}{'hit ns/op':>11}{'miss ns/op':>12}")
+    for name, create_table in tables.items():
+        table, allocated_bytes = measure_build(create_table, keys)
+        hit_ns = time_per_operation(table.get, keys)
+        miss_ns = time_per_operation(table.get, missing_keys)
+        print(f"{name:<18}{allocated_bytes / key_count:>13.1f}{hit_ns:>11.0f}{miss_ns:>12.0f}")
+
+
+def benchmark_int_keys(key_count=200_000):
+    """
+    Compares memory per entry and lookup throughput of the chaining and the int-key tables
+    holding random 64-bit int keys. The keys are shared by both tables, so their own memory is not counted.
+    """
+    keys = list({random.randrange(-(1 << 62), 1 << 62) for _ in range(key_count)})
+    missing_keys = [key + 1 for key in keys]  # Nearly all absent, since the keys are sparse
+    tables = {
+        "Chaining": lambda: HashTable(16, HashFunctonType.Fibonacci),
+        "Int keys": lambda: IntHashTable(16),
+    }
+    print(f"{'Table':<18}{'bytes/entry':>13}{'hit ns/op':>11}{'miss ns/op':>12}")
+    for name, create_table in tables.items():
+        table, allocated_bytes = measure_build(create_table, keys)
+        hit_ns = time_per_operation(table.get, keys)
+        miss_ns = time_per_operation(table.get, missing_keys)
+        print(f"{name:<18}{allocated_bytes / len(keys):>13.1f}{hit_ns:>11.0f}{miss_ns:>12.0f}")
+
+
+def benchmark_rehash(key_count=200_000):
+    """
+    Measures how long a full rehash of a table holding long string keys takes.
+    """
+    keys = [f"{'long-key-prefix-' * 8}{i}" for i in range(key_count)]
+    print(f"{'Hash function':<16}{'capacity':>10}{'rehash ms':>11}")
+    for hash_function_type in HashFunctonType:
+        hash_table = HashTable(16, hash_function_type)
+        for key in keys:
+            hash_table.put(key, key)
+        start = time.perf_counter_ns()
+        hash_table.rehash()
+        rehash_ms = (time.perf_counter_ns() - start) / 1_000_000
+        print(f"{hash_function_type.name:<16}{len(hash_table.bucket_array):>10}{rehash_ms:>11.1f}")
+
+
+def benchmark_bulk_load(key_count=500_000):
+    """
+    Compares loading pairs one put at a time with the batch APIs.
+    """
+    items = [(f"key-{i}", i) for i in range(key_count)]
+    keys = [key for key, _ in items]
+
+    def load_with_put():
+        hash_table = HashTable(16, HashFunctonType.Division)
+        for key, value in items:
+            hash_table.put(key, value)
+        return hash_table
+
+    def load_with_put_many():
+        hash_table = HashTable(16, HashFunctonType.Division)
+        hash_table.put_many(items)
+        return hash_table
+
+    loaders = {
+        "put": load_with_put,
+        "put_many": load_with_put_many,
+        "from_items": lambda: HashTable.from_items(items, HashFunctonType.Division),
+    }
+    print(f"{'Loader':<12}{'load ns/op':>12}{'get_many ns/op':>16}")
+    for name, load in loaders.items():
+        start = time.perf_counter_ns()
+        hash_table = load()
+        load_ns = (time.perf_counter_ns() - start) / key_count
+        start = time.perf_counter_ns()
+        hash_table.get_many(keys)
+        get_ns = (time.perf_counter_ns() - start) / key_count
+        print(f"{name:<12}{load_ns:>12.0f}{get_ns:>16.0f}")
+
+
+def benchmark_shrink(key_count=200_000, cycles=3, kept_count=1_000):
+    """
+    Measures the memory a table still holds after cycles of bulk inserts followed by mass removals,
+    with and without shrinking on delete.
+    """
+    print(f"{'Shrink on delete':<18}{'capacity':>10}{'retained bytes':>16}")
+    for shrink_on_delete in (False, True):
+        tracemalloc.start()
+        hash_table = HashTable(16, HashFunctonType.Division, shrink_on_delete=shrink_on_delete)
+        for _ in range(cycles):
+            for i in range(key_count):
+                hash_table.put(i, i)
+            for i in range(kept_count, key_count):
+                hash_table.remove(i)
+        retained_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{str(shrink_on_delete):<18}{len(hash_table.bucket_array):>10}{retained_bytes:>16}")
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Returns the sample below which the given fraction of the sorted samples falls.
+    """
+    return sorted_samples[min(int(len(sorted_samples) * fraction), len(sorted_samples) - 1)]
+
+
+def benchmark_incremental_rehash(key_count=1_000_000):
+    """
+    Compares put latency percentiles of a table rehashing all entries at once
+    with one migrating a few buckets per operation.
+    The garbage collector is paused so that its own pauses do not hide the rehashing ones.
+    """
+    print(f"{'Rehash':<14}{'p50 ns':>10}{'p99 ns':>10}{'p99.9 ns':>11}{'max ns':>14}")
+    for name, incremental_rehash in (("Full", False), ("Incremental", True)):
+        hash_table = HashTable(16, HashFunctonType.Fibonacci, incremental_rehash)
+        latencies = []
+        gc.disable()
+        for i in range(key_count):
+            start = time.perf_counter_ns()
+            hash_table.put(i, i)
+            latencies.append(time.perf_counter_ns() - start)
+        gc.enable()
+        latencies.sort()
+        print(f"{name:<14}{percentile(latencies, 0.5):>10}{percentile(latencies, 0.99):>10}"
+              f"{percentile(latencies, 0.999):>11}{latencies[-1]:>14}")
+
+
+def benchmark_cuckoo(key_count=200_000):
+    """
+    Compares get latency percentiles of the chaining and the cuckoo tables holding the same keys.
+    The cuckoo table keeps a much higher load factor, which is reported next to the latencies.
+    """
+    tables = {
+        "Chaining": (HashTable(16, HashFunctonType.Fibonacci), lambda table: len(table.bucket_array)),
+        "Cuckoo": (CuckooHashTable(16), lambda table: len(table.hashes)),
+    }
+    keys = [f"key-{i}" for i in range(key_count)]
+    print(f"{'Table':<10}{'load':>6}{'p50 ns':>9}{'p99 ns':>9}{'p99.9 ns':>10}{'max ns':>10}")
+    for name, (table, capacity_of) in tables.items():
+        for key in keys:
+            table.put(key, key)
+        latencies = []
+        gc.disable()
+        for key in keys:
+            start = time.perf_counter_ns()
+            table.get(key)
+            latencies.append(time.perf_counter_ns() - start)
+        gc.enable()
+        latencies.sort()
+        print(f"{name:<10}{table.size / capacity_of(table):>6.2f}{percentile(latencies, 0.5):>9}"
+              f"{percentile(latencies, 0.99):>9}{percentile(latencies, 0.999):>10}{latencies[-1]:>10}")
+
+
+class GlobalLockHashTable:
+    """
+    Baseline for the concurrency benchmark: a HashTable with every operation behind one lock.
+    """
+
+    def __init__(self, capacity, hash_function_type):
+        self.table = HashTable(capacity, hash_function_type)
+        self.lock = threading.Lock()
+
+    def put(self, key, value):
+        with self.lock:
+            self.table.put(key, value)
+
+    def get(self, key):
+        with self.lock:
+            return self.table.get(key)
+
+
+def run_workers(table, thread_count, operation_count, write_fraction, key_count):
+    """
+    Runs worker threads performing a random mix of get and put operations on shared keys.
+
+    :return: the number of operations completed per second by all threads together
+    """
+    def work(seed):
+        generator = random.Random(seed)
+        for _ in range(operation_count):
+            key = generator.randrange(key_count)
+            if generator.random() < write_fraction:
+                table.put(key, seed)
+            else:
+                table.get(key)
+
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(thread_count)]
+    start = time.perf_counter_ns()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return thread_count * operation_count / ((time.perf_counter_ns() - start) / 1_000_000_000)
+
+
+def benchmark_concurrency(operation_count=50_000, key_count=10_000):
+    """
+    Compares the throughput of a globally locked table and the striped concurrent table
+    under read-heavy and write-heavy workloads for several thread counts.
+    """
+    mixes = {"read-heavy": 0.05, "write-heavy": 0.5}
+    print(f"{'Table':<14}{'workload':<13}{'threads':>8}{'ops/s':>12}")
+    for name, create_table in (("Global lock", GlobalLockHashTable), ("Striped", ConcurrentHashTable)):
+        for workload, write_fraction in mixes.items():
+            for thread_count in (1, 2, 4, 8):
+                table = create_table(key_count, HashFunctonType.Fibonacci)
+                for key in range(key_count):
+                    table.put(key, key)
+                throughput = run_workers(table, thread_count, operation_count, write_fraction, key_count)
+                print(f"{name:<14}{workload:<13}{thread_count:>8}{throughput:>12.0f}")
+
+
+def benchmark_snapshot(key_count=500_000):
+    """
+    Compares rebuilding a table from its pairs with reloading a snapshot of it.
+    """
+    items = [(f"key-{i}", i) for i in range(key_count)]
+    hash_table = HashTable.from_items(items, HashFunctonType.Division)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'hash_table.snapshot')
+        start = time.perf_counter_ns()
+        hash_table.save(path)
+        save_ms = (time.perf_counter_ns() - start) / 1e6
+        loaders = {
+            "from_items": lambda: HashTable.from_items(items, HashFunctonType.Division),
+            "load": lambda: HashTable.load(path),
+        }
+        print(f"Snapshot of {os.path.getsize(path)} bytes saved in {save_ms:.0f} ms")
+        print(f"{'Loader':<12}{'load ms':>10}")
+        for name, load in loaders.items():
+            start = time.perf_counter_ns()
+            load()
+            print(f"{name:<12}{(time.perf_counter_ns() - start) / 1e6:>10.0f}")
+
+
+def benchmark_bloom_filter(key_count=200_000, lookup_count=200_000):
+    """
+    Compares get timings with and without the Bloom filter for increasing shares of lookups
+    of absent keys, and reports the false positive rate measured on those lookups.
+    """
+    keys = [f"key-{i}" for i in range(key_count)]
+    absent_keys = [f"absent-{i}" for i in range(lookup_count)]
+    plain_table = HashTable.from_items(((key, key) for key in keys), HashFunctonType.Fibonacci, key_count)
+    filtered_table = HashTable.from_items(((key, key) for key in keys), HashFunctonType.Fibonacci, key_count)
+    filtered_table.enable_bloom_filter()
+    print(f"{'Miss ratio':<12}{'plain ns/op':>13}{'bloom ns/op':>13}{'speedup':>9}{'false positives':>17}")
+    for miss_ratio in (0.0, 0.5, 0.9, 1.0):
+        miss_count = int(lookup_count * miss_ratio)
+        lookups = random.sample(keys, lookup_count - miss_count) + absent_keys[:miss_count]
+        random.shuffle(lookups)
+        plain_ns = time_per_operation(plain_table.get, lookups)
+        bloom_ns = time_per_operation(filtered_table.get, lookups)
+        # Repeat the lookups with statistics, which slow get down, to count the false positives
+        filtered_table.enable_stats()
+        for key in lookups:
+            filtered_table.get(key)
+        false_positive_rate = filtered_table.get_stats()['measured_false_positive_rate']
+        filtered_table.disable_stats()
+        print(f"{miss_ratio:<12.0%}{plain_ns:>13.0f}{bloom_ns:>13.0f}{plain_ns / bloom_ns:>8.2f}x"
+              f"{false_positive_rate:>17.2%}")
+
+
+def benchmark_sharded_build(key_count=1_000_000, worker_counts=(1, 2, 4, 8)):
+    """
+    Compares building one table with from_items against building a sharded table with
+    increasing numbers of worker processes. The speedup is bounded by the partitioning, the only
+    part of the build left to the calling process, and by the number of CPUs.
+    """
+    items = [(f"key-{i}", i) for i in range(key_count)]
+    start = time.perf_counter_ns()
+    HashTable.from_items(items, HashFunctonType.Fibonacci)
+    baseline_ms = (time.perf_counter_ns() - start) / 1e6
+    print(f"from_items: {baseline_ms:.0f} ms ({os.cpu_count()} CPUs)")
+    print(f"{'Workers':<10}{'build ms':>10}{'speedup':>9}")
+    for worker_count in worker_counts:
+        start = time.perf_counter_ns()
+        table = ShardedHashTable.build(items, HashFunctonType.Fibonacci, worker_count)
+        build_ms = (time.perf_counter_ns() - start) / 1e6
+        table.close()
+        print(f"{worker_count:<10}{build_ms:>10.0f}{baseline_ms / build_ms:>8.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark_hash_functions()
+    print()
+    benchmark_open_addressing()
+    print()
+    benchmark_int_keys()
+    print()
+    benchmark_rehash()
+    print()
+    benchmark_bulk_load()
+    print()
+    benchmark_snapshot()
+    print()
+    benchmark_bloom_filter()
+    print()
+    benchmark_shrink()
+    print()
+    benchmark_incremental_rehash()
+    print()
+    benchmark_cuckoo()
+    print()
+    benchmark_concurrency()
+    print()
+    benchmark_sharded_build()
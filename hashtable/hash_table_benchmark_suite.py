@@ -0,0 +1,240 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from hashtable.hash_table import HashFunctonType, HashTable
+from hashtable.hash_table_benchmark import percentile
+
+# Ints that are multiples of the modulus of the built-in int hash all hash to 0,
+# so they collide in every bucket array and in dict alike
+COLLIDING_MODULUS = sys.hash_info.modulus
+LATENCY_PERCENTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99, 'p99.9': 0.999}
+REHASH_REPEATS = 5
+
+
+def sequential_ints(count, rng):
+    """
+    Returns the ints from 0 to count - 1
+    """
+    return list(range(count))
+
+
+def random_ints(count, rng):
+    """
+    Returns distinct random non-negative ints below 2 ** 62
+    """
+    keys = set()
+    while len(keys) < count:
+        keys.add(rng.randrange(1 << 62))
+    return list(keys)
+
+
+def short_strings(count, rng):
+    """
+    Returns distinct short hexadecimal strings in random order
+    """
+    return [f"{i:x}" for i in rng.sample(range(count * 16), count)]
+
+
+def long_strings(count, rng):
+    """
+    Returns distinct 256-character strings sharing a long prefix
+    """
+    prefix = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(240))
+    return [f"{prefix}{i:016x}" for i in range(count)]
+
+
+def colliding_ints(count, rng):
+    """
+    Returns distinct ints all having the same hash code
+    """
+    return [i * COLLIDING_MODULUS for i in range(count)]
+
+
+# Key generators, taking the number of keys and a random generator
+KEY_DISTRIBUTIONS = {
+    'sequential_ints': sequential_ints,
+    'random_ints': random_ints,
+    'short_strings': short_strings,
+    'long_strings': long_strings,
+    'colliding_ints': colliding_ints,
+}
+
+
+class DictTable:
+    """
+    Exposes the built-in dict through the put, get and remove methods of the hash tables
+    """
+
+    def __init__(self):
+        self.items = {}
+
+    def put(self, key, value):
+        self.items[key] = value
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def remove(self, key):
+        return self.items.pop(key, None) is not None
+
+
+def hash_table_factory(hash_function_type):
+    """
+    Returns a callable creating an empty HashTable with the given hash function
+    """
+    return lambda: HashTable(16, hash_function_type)
+
+
+# Table factories by name, the dict being the baseline
+TABLES = {
+    **{f'HashTable[{hash_function_type.name}]': hash_table_factory(hash_function_type)
+       for hash_function_type in HashFunctonType},
+    'dict': DictTable,
+}
+
+
+def run_timed(operation, keys, timed_operation=None):
+    """
+    Runs an operation for every key, once as a whole and once timing every call.
+    :param timed_operation: the operation of the second run, the same operation by default
+    :return: the total duration of the first run and the sorted durations of the calls of the second one,
+    in nanoseconds
+    """
+    if timed_operation is None:
+        timed_operation = operation
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for key in keys:
+            operation(key)
+        total_ns = time.perf_counter_ns() - start
+        latencies = []
+        for key in keys:
+            start = time.perf_counter_ns()
+            timed_operation(key)
+            latencies.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    latencies.sort()
+    return total_ns, latencies
+
+
+def summarize(table_name, distribution, operation, count, total_ns, latencies):
+    """
+    Creates the result record of an operation
+    """
+    latency_ns = {name: percentile(latencies, fraction) for name, fraction in LATENCY_PERCENTILES.items()}
+    latency_ns['max'] = latencies[-1]
+    return {
+        'table': table_name,
+        'distribution': distribution,
+        'operation': operation,
+        'count': count,
+        'ops_per_second': count / total_ns * 1e9 if total_ns else None,
+        'latency_ns': latency_ns,
+    }
+
+
+def measure_peak_memory(create_table, keys):
+    """
+    Builds a table holding the given keys and measures the peak memory allocated meanwhile.
+    The keys exist beforehand, so their own memory is not counted.
+    """
+    tracemalloc.start()
+    table = create_table()
+    for key in keys:
+        table.put(key, key)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_bytes
+
+
+def benchmark_table(table_name, create_table, distribution, keys):
+    """
+    Measures put, get, remove and, for the hash tables, rehash on one table with one key distribution
+    :return: the result records
+    """
+    records = []
+
+    # Put: both runs insert every key into a fresh table, so the timings and the latency percentiles
+    # include the growth of the table
+    table = create_table()
+    timed_table = create_table()
+    total_ns, latencies = run_timed(lambda key: table.put(key, key), keys, lambda key: timed_table.put(key, key))
+    record = summarize(table_name, distribution, 'put', len(keys), total_ns, latencies)
+    record['peak_memory_bytes'] = measure_peak_memory(create_table, keys)
+    record['bytes_per_entry'] = record['peak_memory_bytes'] / len(keys)
+    records.append(record)
+
+    total_ns, latencies = run_timed(table.get, keys)
+    records.append(summarize(table_name, distribution, 'get', len(keys), total_ns, latencies))
+
+    if isinstance(table, HashTable):
+        rehash_latencies = []
+        for _ in range(REHASH_REPEATS):
+            start = time.perf_counter_ns()
+            table.rehash(len(table.bucket_array))  # Relinks every entry without resizing
+            rehash_latencies.append(time.perf_counter_ns() - start)
+        rehash_latencies.sort()
+        records.append(summarize(table_name, distribution, 'rehash', REHASH_REPEATS,
+                                 sum(rehash_latencies), rehash_latencies))
+
+    # Remove: both runs remove every key, the individually timed one from the table filled by the timed put run,
+    # so that every timed call removes a present key
+    total_ns, latencies = run_timed(table.remove, keys, timed_table.remove)
+    records.append(summarize(table_name, distribution, 'remove', len(keys), total_ns, latencies))
+    return records
+
+
+def run_suite(key_count, colliding_key_count, seed=0, table_names=None, distributions=None):
+    """
+    Runs every benchmark of the suite
+    :param key_count: the number of keys of each distribution
+    :param colliding_key_count: the number of colliding keys, which take quadratic time in dict
+    :param seed: the seed of the random key generators
+    :param table_names: the names of the tables to benchmark, by default all of TABLES
+    :param distributions: the names of the key distributions, by default all of KEY_DISTRIBUTIONS
+    :return: a JSON-serializable report
+    """
+    results = []
+    for distribution in distributions or KEY_DISTRIBUTIONS:
+        count = colliding_key_count if distribution == 'colliding_ints' else key_count
+        keys = KEY_DISTRIBUTIONS[distribution](count, random.Random(seed))
+        for table_name in table_names or TABLES:
+            results.extend(benchmark_table(table_name, TABLES[table_name], distribution, keys))
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'key_count': key_count,
+        'colliding_key_count': colliding_key_count,
+        'seed': seed,
+        'results': results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the hash tables against dict and reports JSON")
+    parser.add_argument('--keys', type=int, default=100_000, help="number of keys per distribution")
+    parser.add_argument('--colliding-keys', type=int, default=2_000, help="number of colliding keys")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the random key generators")
+    parser.add_argument('--table', action='append', choices=list(TABLES), help="table to benchmark, repeatable")
+    parser.add_argument('--distribution', action='append', choices=list(KEY_DISTRIBUTIONS),
+                        help="key distribution to benchmark, repeatable")
+    parser.add_argument('--output', help="file receiving the report, instead of the standard output")
+    arguments = parser.parse_args()
+
+    report = run_suite(arguments.keys, arguments.colliding_keys, arguments.seed,
+                       arguments.table, arguments.distribution)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
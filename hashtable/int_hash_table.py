@@ -0,0 +1,172 @@
+from array import array
+
+from hashtable.hash_table import FIBONACCI_MULTIPLIER, WORD_BITS, WORD_MASK, next_power_of_two
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+# Key stored in empty slots. The key with this value is held outside of the slot arrays.
+EMPTY_KEY = INT64_MIN
+VALUE_TYPECODES = ('q', 'd')  # Values are either 64-bit ints or floats
+
+
+class IntHashTable:
+    """
+    A hash table specialized for 64-bit int keys and int or float values.
+    Keys and values are stored unboxed in two arrays of the array module, 16 bytes per slot,
+    instead of in entry objects pointing to int objects. Slots are resolved with open addressing
+    and linear probing, empty slots hold EMPTY_KEY, and deletion shifts the following entries
+    back, so no tombstones are needed.
+
+    Keys are placed by Fibonacci hashing of the key itself, which spreads sequential keys over
+    the whole array, so neither hash() nor a comparison through == of boxed objects is involved.
+    """
+
+    def __init__(self, capacity, value_typecode='q', max_load_factor=0.75):
+        """
+        :param capacity: the initial number of slots, rounded up to a power of two
+        :param value_typecode: 'q' for int values, 'd' for float values
+        :param max_load_factor: the fraction of occupied slots above which the arrays grow
+        """
+        if capacity < 1:
+            raise ValueError("Initial capacity must be >= 1")
+        if value_typecode not in VALUE_TYPECODES:
+            raise ValueError(f"Value type code must be one of {VALUE_TYPECODES}")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("Maximum load factor must be between 0 and 1")
+        self.value_typecode = value_typecode
+        self.max_load_factor = max_load_factor
+        self.allocate(next_power_of_two(max(capacity, 2)))
+        self.size = 0  # Number of key-value pairs in the hash table
+        self.has_empty_key = False  # Whether the key equal to EMPTY_KEY is present
+        self.empty_key_value = None  # Value of the key equal to EMPTY_KEY
+
+    def allocate(self, capacity):
+        """
+        Replaces the slot arrays with empty ones of the given power-of-two capacity
+        """
+        self.keys = array('q', [EMPTY_KEY]) * capacity
+        self.values = array(self.value_typecode, [0]) * capacity
+        self.mask = capacity - 1
+        self.shift = WORD_BITS - (capacity.bit_length() - 1)
+
+    def home_slot(self, key):
+        """
+        Computes the slot where a key ideally resides
+        """
+        return ((key & WORD_MASK) * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.shift
+
+    def find_slot(self, key):
+        """
+        Finds the slot holding a key, or the empty slot ending its probe sequence if it is absent
+        """
+        keys, mask = self.keys, self.mask
+        slot = ((key & WORD_MASK) * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.shift
+        stored_key = keys[slot]
+        while stored_key != key and stored_key != EMPTY_KEY:
+            slot = (slot + 1) & mask
+            stored_key = keys[slot]
+        return slot
+
+    def put(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        :param key: the key to insert or update, an int between INT64_MIN and INT64_MAX
+        :param value: the value associated with the key, an int or a float depending on the value type code
+        """
+        if not INT64_MIN <= key <= INT64_MAX:
+            raise OverflowError("Key does not fit in a 64-bit signed integer")
+        if key == EMPTY_KEY:
+            self.empty_key_value = array(self.value_typecode, [value])[0]  # Same conversion as in the array
+            if not self.has_empty_key:
+                self.has_empty_key = True
+                self.size += 1
+            return
+
+        slot = self.find_slot(key)
+        if self.keys[slot] == key:
+            # Key found, update value
+            self.values[slot] = value
+            return
+        # Check if adding a new entry would exceed the load factor and trigger rehashing if necessary
+        if (self.size + 1) / len(self.keys) > self.max_load_factor:
+            self.rehash()
+            slot = self.find_slot(key)
+        self.values[slot] = value  # Store the value first, so that a value of the wrong type leaves no key behind
+        self.keys[slot] = key
+        self.size += 1
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        if key == EMPTY_KEY:
+            return self.empty_key_value
+        if not INT64_MIN <= key <= INT64_MAX:
+            return None
+        slot = self.find_slot(key)
+        return self.values[slot] if self.keys[slot] == key else None
+
+    def remove(self, key):
+        """
+        Removes a key-value pair from the hash table, shifting back the entries following it
+        in its probe sequence.
+        :param key: the key of the pair to be removed
+        :return: True if the pair was successfully removed, False if the key was not found
+        """
+        if key == EMPTY_KEY:
+            if not self.has_empty_key:
+                return False
+            self.has_empty_key = False
+            self.empty_key_value = None
+            self.size -= 1
+            return True
+        if not INT64_MIN <= key <= INT64_MAX:
+            return False
+        slot = self.find_slot(key)
+        keys, values, mask = self.keys, self.values, self.mask
+        if keys[slot] != key:
+            return False
+
+        next_slot = (slot + 1) & mask
+        while keys[next_slot] != EMPTY_KEY:
+            home = self.home_slot(keys[next_slot])
+            # An entry may fill the hole unless its home slot lies cyclically after the hole,
+            # up to its current slot, in which case moving it would put it before its home
+            if (next_slot - home) & mask >= (next_slot - slot) & mask:
+                keys[slot] = keys[next_slot]
+                values[slot] = values[next_slot]
+                slot = next_slot
+            next_slot = (next_slot + 1) & mask
+        keys[slot] = EMPTY_KEY
+        values[slot] = 0
+        self.size -= 1
+        return True
+
+    def rehash(self):
+        """
+        Doubles the number of slots and reinserts all existing entries
+        """
+        old_keys, old_values = self.keys, self.values
+        self.allocate(len(old_keys) * 2)
+        keys, values, mask, shift = self.keys, self.values, self.mask, self.shift
+        for key, value in zip(old_keys, old_values):
+            if key != EMPTY_KEY:
+                slot = ((key & WORD_MASK) * FIBONACCI_MULTIPLIER & WORD_MASK) >> shift
+                while keys[slot] != EMPTY_KEY:
+                    slot = (slot + 1) & mask
+                keys[slot] = key
+                values[slot] = value
+
+    def print_hash_table(self):
+        """
+        Prints the entire contents of the hash table
+        """
+        for i, key in enumerate(self.keys):
+            if key == EMPTY_KEY:
+                print(f'[{i}]')
+            else:
+                print(f'[{i}]|{key}, {self.values[i]}|')
+        if self.has_empty_key:
+            print(f'[empty key]|{EMPTY_KEY}, {self.empty_key_value}|')
@@ -0,0 +1,182 @@
+import time
+
+from hashtable.hash_table import HashFunctonType, HashTable
+
+SWEEP_BATCH = 8  # Least recently used entries checked for expiry on every insertion
+
+
+class CacheNode:
+    """
+    Represents a cached key-value pair. Nodes are stored as the values of the hash table
+    and are linked into a doubly linked list ordered by recency of use.
+    """
+
+    __slots__ = ('key', 'value', 'expires_at', 'prev', 'next')
+
+    def __init__(self, key=None, value=None, expires_at=None):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at  # Clock time after which the entry is stale, or None
+        self.prev = None
+        self.next = None
+
+
+class LruCache:
+    """
+    A bounded cache evicting the least recently used entry when it is full.
+    The hash table finds the node of a key, and the recency list orders the nodes,
+    so that lookups, promotions and evictions all take constant time.
+
+    Entries may also expire after a time to live. Expired entries are dropped lazily when
+    they are looked up, and by a sweep over a few least recently used entries on every insertion.
+    """
+
+    def __init__(self, max_size, default_ttl=None, clock=time.monotonic,
+                 hash_function_type=HashFunctonType.Fibonacci):
+        """
+        :param max_size: the maximum number of entries in the cache
+        :param default_ttl: the time to live of entries, in clock units, or None for entries that never expire
+        :param clock: a callable returning the current time
+        :param hash_function_type: the hash function of the underlying hash table
+        """
+        if max_size < 1:
+            raise ValueError("Maximum size must be >= 1")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.table = HashTable(int(max_size / 0.75) + 1, hash_function_type)
+        # Sentinel node: head.next is the most recently used node, head.prev the least recently used one
+        self.head = CacheNode()
+        self.head.prev = self.head
+        self.head.next = self.head
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def size(self):
+        """
+        Returns the number of entries in the cache, including expired ones not dropped yet
+        """
+        return self.table.size
+
+    def link_first(self, node):
+        """
+        Links a node at the most recently used end of the list
+        """
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+
+    @staticmethod
+    def unlink(node):
+        """
+        Unlinks a node from the list
+        """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def is_expired(self, node):
+        """
+        Checks whether the time to live of a node has passed
+        """
+        return node.expires_at is not None and node.expires_at <= self.clock()
+
+    def drop(self, node):
+        """
+        Removes a node from both the list and the hash table
+        """
+        self.unlink(node)
+        self.table.remove(node.key)
+
+    def get(self, key):
+        """
+        Retrieves the value of a key and marks the key as the most recently used one.
+        :param key: the key whose value is to be retrieved
+        :return: the value, or None if the key is not cached or has expired
+        """
+        node = self.table.get(key)
+        if node is None:
+            self.misses += 1
+            return None
+        if self.is_expired(node):
+            self.drop(node)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.unlink(node)
+        self.link_first(node)
+        self.hits += 1
+        return node.value
+
+    def put(self, key, value, ttl=None):
+        """
+        Inserts or updates a key-value pair, evicting the least recently used entry if the cache is full.
+        :param key: the key to insert or update
+        :param value: the value associated with the key
+        :param ttl: the time to live of the entry, defaulting to the cache's default time to live
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        node = self.table.get(key)
+        if node is not None:
+            node.value = value
+            node.expires_at = expires_at
+            self.unlink(node)
+            self.link_first(node)
+            return
+
+        self.sweep_expired(SWEEP_BATCH)
+        if self.table.size >= self.max_size:
+            self.drop(self.head.prev)
+            self.evictions += 1
+        node = CacheNode(key, value, expires_at)
+        self.table.put(key, node)
+        self.link_first(node)
+
+    def remove(self, key):
+        """
+        Removes a key from the cache.
+        :return: True if the key was cached, False otherwise
+        """
+        node = self.table.get(key)
+        if node is None:
+            return False
+        self.drop(node)
+        return True
+
+    def sweep_expired(self, max_checks):
+        """
+        Drops expired entries among the `max_checks` least recently used ones.
+        :return: the number of dropped entries
+        """
+        dropped_count = 0
+        node = self.head.prev
+        for _ in range(max_checks):
+            if node is self.head:
+                break
+            previous = node.prev
+            if self.is_expired(node):
+                self.drop(node)
+                dropped_count += 1
+            node = previous
+        self.expirations += dropped_count
+        return dropped_count
+
+    def get_stats(self):
+        """
+        Reports the cache counters
+        :return: a dictionary of statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': self.size,
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
@@ -0,0 +1,191 @@
+import hashlib
+import mmap
+import struct
+from array import array
+
+from hashtable.hash_table import HashFunctonType, adjust_capacity, compute_index
+
+MAGIC = b'HTMAP001'
+# Header: magic, hash function type, capacity, size, heap offset
+HEADER = struct.Struct('<8sIQQQ')
+# Slot: hash code and offset of the record in the heap, where offset 0 marks an empty slot
+SLOT = struct.Struct('<QQ')
+# Record header: key length, value length, key type tag, value type tag
+RECORD = struct.Struct('<IIBB')
+BYTES_TAG = 0
+STR_TAG = 1
+INT_TAG = 2  # Signed little-endian bytes, as long as the int needs
+FLOAT_TAG = 3  # IEEE 754 double
+FLOAT = struct.Struct('<d')
+MAX_LOAD_FACTOR = 0.5
+
+
+def encode(data):
+    """
+    Converts a key or a value into bytes and a tag telling its original type
+    """
+    if isinstance(data, bytes):
+        return data, BYTES_TAG
+    if isinstance(data, str):
+        return data.encode('utf-8'), STR_TAG
+    if type(data) is int:  # Not bool, which would come back as an int
+        return data.to_bytes(data.bit_length() // 8 + 1, 'little', signed=True), INT_TAG
+    if type(data) is float:
+        return FLOAT.pack(data), FLOAT_TAG
+    raise TypeError("Values must be str, bytes, int or float")
+
+
+def encode_key(key):
+    """
+    Converts a key into bytes and a tag telling its original type. Keys are limited to str and bytes,
+    as numbers equal in the in-memory HashTable, such as 1 and 1.0, would be distinct keys here.
+    """
+    if not isinstance(key, (str, bytes)):
+        raise TypeError("Keys must be str or bytes")
+    return encode(key)
+
+
+def decode(data, tag):
+    """
+    Restores a key or a value from its bytes and type tag
+    """
+    if tag == STR_TAG:
+        return data.decode('utf-8')
+    if tag == INT_TAG:
+        return int.from_bytes(data, 'little', signed=True)
+    if tag == FLOAT_TAG:
+        return FLOAT.unpack(data)[0]
+    return data
+
+
+def stable_hash(data):
+    """
+    Computes a 64-bit hash code of bytes that, unlike the built-in hash of str and bytes,
+    is the same in every process, so it can be stored in a file
+    """
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class MappedHashTable:
+    """
+    A read-only hash table stored in a file and accessed through a memory mapping.
+    The file holds a header, an array of fixed-size slots and a heap of key-value records.
+    Slots are resolved with open addressing and linear probing; each slot holds the hash code of
+    its key and the offset of its record in the heap.
+
+    Opening a table only maps the file, and lookups read the few slots and the record they need,
+    so the operating system pages in just the touched parts of the file. Keys are str or bytes,
+    values str, bytes, int or float. Bucket indices come from the capacity and hash functions of
+    hashtable.hash_table, applied to a hash code that is stable across processes.
+    """
+
+    def __init__(self, path):
+        """
+        Opens a table file written by MappedHashTable.build.
+        :param path: the path of the table file
+        """
+        with open(path, 'rb') as file:
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, hash_function_value, capacity, size, heap_offset = HEADER.unpack_from(self.mapping, 0)
+        if magic != MAGIC:
+            self.mapping.close()
+            raise ValueError("Not a mapped hash table file")
+        self.hash_function_type = HashFunctonType(hash_function_value)
+        self.capacity = capacity
+        self.size = size
+        self.heap_offset = heap_offset
+
+    @staticmethod
+    def build(path, items, hash_function_type=HashFunctonType.Fibonacci):
+        """
+        Writes a table file holding the given key-value pairs. When a key occurs several times,
+        its last value is kept.
+        :param path: the path of the table file to write
+        :param items: an iterable of (key, value) pairs
+        :param hash_function_type: the hash function used to place the keys
+        """
+        records = [(encode_key(key), encode(value)) for key, value in items]
+        capacity = adjust_capacity(int(len(records) / MAX_LOAD_FACTOR) + 1, hash_function_type)
+        slot_hashes = array('Q', bytes(8 * capacity))
+        slot_offsets = array('Q', bytes(8 * capacity))
+        slot_keys = [None] * capacity  # Encoded keys of the occupied slots, to detect repeated keys
+        heap_offset = HEADER.size + SLOT.size * capacity
+        size = 0
+
+        with open(path, 'wb') as file:
+            file.seek(heap_offset)
+            offset = heap_offset
+            for (key, key_tag), (value, value_tag) in records:
+                hash_code = stable_hash(key)
+                slot = compute_index(hash_code, capacity, hash_function_type)
+                while slot_offsets[slot] != 0 and not (slot_hashes[slot] == hash_code
+                                                       and slot_keys[slot] == (key, key_tag)):
+                    slot = (slot + 1) % capacity
+                if slot_offsets[slot] == 0:
+                    size += 1
+                slot_hashes[slot] = hash_code
+                slot_offsets[slot] = offset  # A repeated key points to its newest record
+                slot_keys[slot] = (key, key_tag)
+                file.write(RECORD.pack(len(key), len(value), key_tag, value_tag))
+                file.write(key)
+                file.write(value)
+                offset += RECORD.size + len(key) + len(value)
+
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, hash_function_type.value, capacity, size, heap_offset))
+            slots = bytearray(SLOT.size * capacity)
+            for slot in range(capacity):
+                SLOT.pack_into(slots, slot * SLOT.size, slot_hashes[slot], slot_offsets[slot])
+            file.write(slots)
+
+    def read_record(self, offset):
+        """
+        Reads the record stored at an offset of the heap
+        :return: the encoded key, its tag, the encoded value and its tag
+        """
+        key_length, value_length, key_tag, value_tag = RECORD.unpack_from(self.mapping, offset)
+        key_start = offset + RECORD.size
+        value_start = key_start + key_length
+        return (self.mapping[key_start:value_start], key_tag,
+                self.mapping[value_start:value_start + value_length], value_tag)
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        key, key_tag = encode_key(key)
+        hash_code = stable_hash(key)
+        slot = compute_index(hash_code, self.capacity, self.hash_function_type)
+        while True:
+            slot_hash, offset = SLOT.unpack_from(self.mapping, HEADER.size + slot * SLOT.size)
+            if offset == 0:
+                return None
+            if slot_hash == hash_code:
+                stored_key, stored_key_tag, value, value_tag = self.read_record(offset)
+                if stored_key == key and stored_key_tag == key_tag:
+                    return decode(value, value_tag)
+            slot = (slot + 1) % self.capacity
+
+    def items(self):
+        """
+        Iterates over the key-value pairs of the table in slot order
+        """
+        for slot in range(self.capacity):
+            _, offset = SLOT.unpack_from(self.mapping, HEADER.size + slot * SLOT.size)
+            if offset != 0:
+                key, key_tag, value, value_tag = self.read_record(offset)
+                yield decode(key, key_tag), decode(value, value_tag)
+
+    def close(self):
+        """
+        Releases the memory mapping
+        """
+        self.mapping.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,205 @@
+from typing import List, Optional
+
+from hashtable.hash_table import (FIBONACCI_MULTIPLIER, WORD_BITS, WORD_MASK, HashFunctonType, adjust_capacity,
+                                  get_index_function)
+
+
+# Probe distance stored for empty slots; lower than any real distance, so lookups stop there
+EMPTY_DISTANCE = -1
+
+
+class OpenAddressingHashTable:
+    """
+    A hash table implementation using open addressing with Robin Hood linear probing.
+    Keys, their cached hash codes, values and probe distances live in parallel lists, so no node object
+    is allocated per entry and a lookup scans neighbouring slots instead of following links.
+
+    Robin Hood probing keeps every probe sequence short: while inserting, an entry that is
+    further from its home slot takes the place of an entry that is closer to its own home.
+    Deletion shifts the following entries one slot back, so no tombstones are needed.
+    """
+
+    def __init__(self, capacity, hash_function_type=HashFunctonType.Fibonacci, max_load_factor=0.9):
+        if capacity < 1:
+            raise ValueError("Initial capacity must be >= 1")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("Maximum load factor must be between 0 and 1")
+        self.hash_function_type = hash_function_type
+        # Resolved once, so that probe sequences start without a dispatch on the hash function type
+        self.index_function = get_index_function(hash_function_type)
+        self.max_load_factor = max_load_factor
+        capacity = adjust_capacity(capacity, hash_function_type)
+        self.fibonacci_shift = self.get_fibonacci_shift(capacity)
+        self.keys: List = [None] * capacity
+        self.hashes: List[Optional[int]] = [None] * capacity  # None marks an empty slot
+        self.values: List = [None] * capacity
+        self.distances: List[int] = [EMPTY_DISTANCE] * capacity  # Distance of each entry from its home slot
+        self.size = 0  # Number of key-value pairs in the hash table
+
+    def get_fibonacci_shift(self, capacity):
+        """
+        Returns the shift mapping a 64-bit Fibonacci product to a slot of the given capacity,
+        or 0 if the table uses another hash function
+        """
+        if self.hash_function_type != HashFunctonType.Fibonacci:
+            return 0
+        return WORD_BITS + 1 - capacity.bit_length()
+
+    def home_index(self, hash_code):
+        """
+        Computes the slot where an entry with the given hash code ideally resides
+        """
+        if self.fibonacci_shift:
+            return (hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> self.fibonacci_shift
+        return self.index_function(hash_code, len(self.hashes))
+
+    def find_slot(self, key, hash_code):
+        """
+        Finds the slot holding the given key.
+        :return: the slot index, or -1 if the key is not in the table
+        """
+        hashes, keys, distances = self.hashes, self.keys, self.distances
+        capacity = len(hashes)
+        # Inlined home_index: Fibonacci hashing is a multiply and a shift over a power-of-two capacity
+        fibonacci_shift = self.fibonacci_shift
+        if fibonacci_shift:
+            slot = (hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> fibonacci_shift
+        else:
+            slot = self.index_function(hash_code, capacity)
+        distance = 0
+        # Robin Hood invariant: once the probe is further from home than the stored entry,
+        # the key would have displaced that entry, so it cannot be further along
+        while distance <= distances[slot]:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return slot
+            slot += 1
+            if slot == capacity:
+                slot = 0
+            distance += 1
+        return -1
+
+    def insert_new(self, key, hash_code, value):
+        """
+        Inserts an entry whose key is known to be absent, displacing entries closer to their home slots
+        """
+        hashes, keys, values, distances = self.hashes, self.keys, self.values, self.distances
+        capacity = len(hashes)
+        # Inlined home_index: Fibonacci hashing is a multiply and a shift over a power-of-two capacity
+        fibonacci_shift = self.fibonacci_shift
+        if fibonacci_shift:
+            slot = (hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> fibonacci_shift
+        else:
+            slot = self.index_function(hash_code, capacity)
+        distance = 0
+        while hashes[slot] is not None:
+            if distances[slot] < distance:
+                # Take the slot and carry on inserting the displaced entry
+                keys[slot], key = key, keys[slot]
+                hashes[slot], hash_code = hash_code, hashes[slot]
+                values[slot], value = value, values[slot]
+                distances[slot], distance = distance, distances[slot]
+            slot += 1
+            if slot == capacity:
+                slot = 0
+            distance += 1
+        keys[slot] = key
+        hashes[slot] = hash_code
+        values[slot] = value
+        distances[slot] = distance
+        self.size += 1
+
+    def put(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        :param key: the key to insert or update
+        :param value: the value associated with the key
+        """
+        hash_code = hash(key)
+        slot = self.find_slot(key, hash_code)
+        if slot >= 0:
+            # Key found, update value
+            self.values[slot] = value
+            return
+        # Check if adding a new entry would exceed the load factor and trigger rehashing if necessary
+        if (self.size + 1) / len(self.hashes) > self.max_load_factor:
+            self.rehash()
+        self.insert_new(key, hash_code, value)
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        # Inlined find_slot, saving a call on the hottest path
+        hash_code = hash(key)
+        hashes, keys, distances = self.hashes, self.keys, self.distances
+        capacity = len(hashes)
+        fibonacci_shift = self.fibonacci_shift
+        if fibonacci_shift:
+            slot = (hash_code * FIBONACCI_MULTIPLIER & WORD_MASK) >> fibonacci_shift
+        else:
+            slot = self.index_function(hash_code, capacity)
+        distance = 0
+        while distance <= distances[slot]:
+            if hashes[slot] == hash_code and keys[slot] == key:
+                return self.values[slot]
+            slot += 1
+            if slot == capacity:
+                slot = 0
+            distance += 1
+        return None
+
+    def remove(self, key):
+        """
+        Removes a key-value pair from the hash table using backward-shift deletion.
+        :param key: the key of the pair to be removed
+        :return: True if the pair was successfully removed, False if the key was not found
+        """
+        slot = self.find_slot(key, hash(key))
+        if slot < 0:
+            return False
+
+        capacity = len(self.hashes)
+        next_slot = (slot + 1) % capacity
+        # Shift back the following entries until an empty slot or an entry at its home slot
+        while self.distances[next_slot] > 0:
+            self.keys[slot] = self.keys[next_slot]
+            self.hashes[slot] = self.hashes[next_slot]
+            self.values[slot] = self.values[next_slot]
+            self.distances[slot] = self.distances[next_slot] - 1
+            slot = next_slot
+            next_slot = (slot + 1) % capacity
+        self.keys[slot] = None
+        self.hashes[slot] = None
+        self.values[slot] = None
+        self.distances[slot] = EMPTY_DISTANCE
+        self.size -= 1
+        return True
+
+    def rehash(self):
+        """
+        Doubles the size of the hash table and reinserts all existing entries using their cached hash codes
+        """
+        old_keys, old_hashes, old_values = self.keys, self.hashes, self.values
+        new_capacity = adjust_capacity(len(old_hashes) * 2, self.hash_function_type)
+        self.fibonacci_shift = self.get_fibonacci_shift(new_capacity)
+        self.keys = [None] * new_capacity
+        self.hashes = [None] * new_capacity
+        self.values = [None] * new_capacity
+        self.distances = [EMPTY_DISTANCE] * new_capacity
+        self.size = 0
+
+        for key, hash_code, value in zip(old_keys, old_hashes, old_values):
+            if hash_code is not None:
+                self.insert_new(key, hash_code, value)
+
+    def print_hash_table(self):
+        """
+        Prints the entire contents of the hash table
+        """
+        for i, hash_code in enumerate(self.hashes):
+            if hash_code is None:
+                print(f'[{i}]')
+            else:
+                print(f'[{i}]|{self.keys[i]}, {self.values[i]}| (probe distance {self.distances[i]})')
@@ -0,0 +1,188 @@
+import multiprocessing
+import os
+import sys
+
+from hashtable.hash_table import HashFunctonType, HashTable
+
+
+def get_context():
+    """
+    Returns the multiprocessing context of the workers. Forked workers inherit the partitions of the
+    calling process instead of receiving them pickled, so fork is used wherever it is available.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def serve_shards(connection, partitions, hash_function_type):
+    """
+    Runs in a worker process: builds the shards of the worker, then answers the requests received over
+    a connection until it receives None or the connection is closed. A request is the name of a HashTable
+    attribute, the index of a shard and the arguments of the call, or None to read the attribute.
+    :param connection: the worker end of the pipe to the ShardedHashTable
+    :param partitions: a dict mapping the index of each shard of the worker to its (key, value) pairs
+    :param hash_function_type: the hash function of the shards
+    """
+    shards = {index: HashTable.from_items(partition, hash_function_type) for index, partition in partitions.items()}
+    del partitions
+    connection.send(None)
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        name, shard_index, args = request
+        try:
+            attribute = getattr(shards[shard_index], name)
+            result = attribute if args is None else attribute(*args)
+            sys.stdout.flush()
+        except Exception as error:
+            connection.send((False, error))
+        else:
+            connection.send((True, result))
+
+
+class ShardedHashTable:
+    """
+    A hash table partitioned into independent HashTable shards, each living in a worker process.
+    Each key belongs to the shard selected by its hash code, and get, put and remove are sent to the
+    worker holding that shard over a pipe, so only that shard is touched.
+
+    ShardedHashTable.build partitions the items in the calling process and starts the workers, which
+    build their shards in parallel and keep them, so no entry is ever copied back to the calling process.
+    Where processes are forked, the workers also inherit their partitions without pickling them. The
+    price is paid by every later operation, which is a round trip to a worker process: the table is
+    meant for building large tables quickly and querying them in bulk, not for tight loops of lookups.
+    Shards hash keys with the hash seed of their worker, while routing uses the one of the calling
+    process, so workers started without the hash seed of the caller still find their keys.
+
+    A table is not thread-safe, and its workers keep running until it is closed.
+    """
+
+    def __init__(self, processes, connections, shard_count):
+        """
+        Wraps running workers; use ShardedHashTable.build to create a table.
+        :param processes: the worker processes
+        :param connections: the pipe connections to the workers, in the same order
+        :param shard_count: the number of shards, the shard of index i being held by worker i modulo
+        the number of workers
+        """
+        self.processes = processes
+        self.connections = connections
+        self.shard_count = shard_count
+
+    @classmethod
+    def build(cls, items, hash_function_type=HashFunctonType.Fibonacci, worker_count=None, shard_count=None):
+        """
+        Creates a sharded hash table holding the given key-value pairs, building the shards in parallel.
+        When a key occurs several times, its last value is kept.
+        :param items: an iterable of (key, value) pairs
+        :param hash_function_type: the hash function of the shards
+        :param worker_count: the number of worker processes, by default the number of CPUs
+        :param shard_count: the number of shards, by default the number of workers
+        """
+        worker_count = worker_count or os.cpu_count() or 1
+        shard_count = shard_count or worker_count
+        if shard_count < worker_count:
+            raise ValueError("Shard count must be >= worker count")
+        partitions = [[] for _ in range(shard_count)]
+        appends = [partition.append for partition in partitions]
+        for item in items:
+            appends[hash(item[0]) % shard_count](item)
+
+        context = get_context()
+        processes, connections = [], []
+        for worker in range(worker_count):
+            connection, worker_connection = context.Pipe()
+            worker_partitions = {index: partitions[index] for index in range(worker, shard_count, worker_count)}
+            process = context.Process(target=serve_shards, args=(worker_connection, worker_partitions,
+                                                                 hash_function_type), daemon=True)
+            process.start()
+            worker_connection.close()
+            processes.append(process)
+            connections.append(connection)
+        for connection in connections:
+            connection.recv()  # Waits for the shards of every worker to be built
+        return cls(processes, connections, shard_count)
+
+    def call(self, shard_index, name, args=None):
+        """
+        Calls a HashTable method of a shard, or reads its attribute when args is None, in the worker
+        holding the shard
+        :return: the result of the call, or the value of the attribute
+        """
+        connection = self.connections[shard_index % len(self.connections)]
+        connection.send((name, shard_index, args))
+        succeeded, result = connection.recv()
+        if not succeeded:
+            raise result
+        return result
+
+    def shard_for(self, hash_code):
+        """
+        Returns the index of the shard responsible for a hash code
+        """
+        return hash_code % self.shard_count
+
+    def put(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        :param key: the key to insert or update
+        :param value: the value associated with the key
+        """
+        self.call(self.shard_for(hash(key)), 'put', (key, value))
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key.
+        :param key: the key whose value is to be retrieved
+        :return: the value associated with the key, or None if the key is not found
+        """
+        return self.call(self.shard_for(hash(key)), 'get', (key,))
+
+    def remove(self, key):
+        """
+        Removes a key-value pair from the hash table.
+        :param key: the key of the pair to be removed
+        :return: True if the pair was successfully removed, False if the key was not found
+        """
+        return self.call(self.shard_for(hash(key)), 'remove', (key,))
+
+    @property
+    def size(self):
+        """
+        Returns the number of key-value pairs in all shards
+        """
+        return sum(self.call(shard_index, 'size') for shard_index in range(self.shard_count))
+
+    def print_hash_table(self):
+        """
+        Prints the entire contents of the hash table, shard by shard
+        """
+        for shard_index in range(self.shard_count):
+            print(f'Shard {shard_index}:', flush=True)
+            self.call(shard_index, 'print_hash_table', ())
+
+    def close(self):
+        """
+        Stops the worker processes, discarding their shards
+        """
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except OSError:
+                pass  # The worker already exited
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()